@@ -1,6 +1,7 @@
 import os
+from functools import lru_cache
 
-from fastapi import Depends
+from fastapi import Request
 
 from config.settings import BaseAppSettings, Settings, TestSettings
 from security.interfaces import JWTAuthManagerInterface
@@ -8,22 +9,21 @@ from security.token_manager import JWTAuthManager
 from notifications.interfaces import EmailSenderInterface
 from notifications.email_sender import EmailSender
 
+@lru_cache(maxsize=1)
 def get_settings() -> BaseAppSettings:
     environment = os.getenv("ENVIRONMENT", "developing")
     if environment == "testing":
         return TestSettings()
     return Settings()
 
-def get_jwt_auth_manager(settings: BaseAppSettings = Depends(get_settings)) -> JWTAuthManagerInterface:
+def build_jwt_auth_manager(settings: BaseAppSettings) -> JWTAuthManagerInterface:
     return JWTAuthManager(
         secret_key_access=settings.SECRET_KEY_ACCESS,
         secret_key_refresh=settings.SECRET_KEY_REFRESH,
         algorithm=settings.JWT_SIGNING_ALGORITHM
     )
 
-def get_accounts_email_notificator(
-    settings: BaseAppSettings = Depends(get_settings)
-) -> EmailSenderInterface:
+def build_accounts_email_notificator(settings: BaseAppSettings) -> EmailSenderInterface:
     return EmailSender(
         hostname=settings.EMAIL_HOST,
         port=settings.EMAIL_PORT,
@@ -36,3 +36,6 @@ def get_accounts_email_notificator(
         password_email_template_name=settings.PASSWORD_RESET_TEMPLATE_NAME,
         password_complete_email_template_name=settings.PASSWORD_RESET_COMPLETE_TEMPLATE_NAME
     )
+
+def get_jwt_auth_manager(request: Request) -> JWTAuthManagerInterface:
+    return request.app.state.jwt_manager
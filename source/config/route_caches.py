@@ -0,0 +1,35 @@
+from config.cache import TTLCache
+
+# Movie metadata and the genre list rarely change; likes and dislikes are
+# still read per request. Entries are per process, so writes made by
+# another worker show up once the TTL runs out.
+movie_detail_cache = TTLCache(maxsize=1024, ttl=600)
+genres_cache = TTLCache(maxsize=1, ttl=600)
+# Serialized /movies/ pages keyed by the full query.
+movie_list_cache = TTLCache(maxsize=256, ttl=60)
+# Totals of filtered movie sets, shared by every page and sort order.
+movie_count_cache = TTLCache(maxsize=1024, ttl=60)
+# Cart responses keyed by user id; they embed movie names, prices and genres.
+cart_cache = TTLCache(maxsize=1024, ttl=30)
+
+
+def invalidate_movie_listings() -> None:
+    movie_list_cache.clear()
+    movie_count_cache.clear()
+
+
+def invalidate_movie(movie_id: int) -> None:
+    """
+    Drop everything that may show a movie that was changed or deleted.
+    """
+    movie_detail_cache.pop(movie_id)
+    invalidate_movie_listings()
+    cart_cache.clear()
+
+
+def invalidate_genres() -> None:
+    genres_cache.clear()
+
+
+def invalidate_cart(user_id: int) -> None:
+    cart_cache.pop(user_id)
@@ -1,23 +1,51 @@
 import os
+import secrets
 from pathlib import Path
-from pydantic_settings import BaseSettings
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class BaseAppSettings(BaseSettings):
+    model_config = SettingsConfigDict(case_sensitive=True, frozen=True, extra="ignore")
+
     BASE_DIR: Path = Path(__file__).parent
     PATH_TO_DB: str = str(BASE_DIR / "test.db")
     SQLITE_DB_URL: str = "sqlite+aiosqlite:///./test.db"
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 25))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 25))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", 1800))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", 30))
+    DB_BUSY_TIMEOUT: int = int(os.getenv("DB_BUSY_TIMEOUT", 30))
+    DB_QUERY_CACHE_SIZE: int = int(os.getenv("DB_QUERY_CACHE_SIZE", 1200))
 
-
-class Settings(BaseAppSettings):
-    SECRET_KEY_ACCESS: str = os.getenv("SECRET_KEY_ACCESS", str(os.urandom(32)))
-    SECRET_KEY_REFRESH: str = os.getenv("SECRET_KEY_REFRESH", str(os.urandom(32)))
+    # Read from the environment by pydantic-settings. The random fallback is
+    # only suitable for a single process: every worker would mint its own key.
+    SECRET_KEY_ACCESS: str = Field(default_factory=lambda: secrets.token_urlsafe(32))
+    SECRET_KEY_REFRESH: str = Field(default_factory=lambda: secrets.token_urlsafe(32))
     JWT_SIGNING_ALGORITHM: str = os.getenv("JWT_SIGNING_ALGORITHM", "HS256")
-    
+
     LOGIN_TIME_DAYS: int = 7
-    
+
+    EMAIL_HOST: str = os.getenv("EMAIL_HOST", "localhost")
+    EMAIL_PORT: int = int(os.getenv("EMAIL_PORT", 1025))
+    EMAIL_HOST_USER: str = os.getenv("EMAIL_HOST_USER", "testuser")
+    EMAIL_HOST_PASSWORD: str = os.getenv("EMAIL_HOST_PASSWORD", "test_password")
+    EMAIL_USE_TLS: bool = os.getenv("EMAIL_USE_TLS", "False").lower() == "true"
+
+    PATH_TO_EMAIL_TEMPLATES_DIR: str = str(BASE_DIR.parent / "templates" / "emails")
+    ACTIVATION_EMAIL_TEMPLATE_NAME: str = "activation_request.html"
+    ACTIVATION_COMPLETE_EMAIL_TEMPLATE_NAME: str = "activation_complete.html"
+    PASSWORD_RESET_TEMPLATE_NAME: str = "password_reset_request.html"
+    PASSWORD_RESET_COMPLETE_TEMPLATE_NAME: str = "password_reset_complete.html"
+
     CELERY_BROKER_URL: str = os.getenv("CELERY_BROKER_URL", "redis://127.0.0.1:6379/0")
     CELERY_RESULT_BACKEND: str = os.environ.get("CELERY_RESULT_BACKEND", "redis://127.0.0.1:6379/0")
+    CELERY_EMAIL_QUEUE: str = os.getenv("CELERY_EMAIL_QUEUE", "emails")
+
+
+class Settings(BaseAppSettings):
+    pass
 
 
 class TestSettings(BaseAppSettings):
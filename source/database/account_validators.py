@@ -2,17 +2,22 @@ import re
 
 import email_validator
 
+UPPERCASE_PATTERN = re.compile(r'[A-Z]')
+LOWERCASE_PATTERN = re.compile(r'[a-z]')
+DIGIT_PATTERN = re.compile(r'\d')
+SPECIAL_CHARACTER_PATTERN = re.compile(r'[@$!%*?&#]')
+
 
 def validate_password_strength(password: str) -> str:
     if len(password) < 8:
         raise ValueError("Password must contain at least 8 characters.")
-    if not re.search(r'[A-Z]', password):
+    if not UPPERCASE_PATTERN.search(password):
         raise ValueError("Password must contain at least on uppercase letter.")
-    if not re.search(r'[a-z]', password):
+    if not LOWERCASE_PATTERN.search(password):
         raise ValueError("Password must contain at least one lower letter.")
-    if not re.search(r'\d', password):
+    if not DIGIT_PATTERN.search(password):
         raise ValueError("Password mast contain at least one digit.")
-    if not re.search(r'[@$!%*?&#]', password):
+    if not SPECIAL_CHARACTER_PATTERN.search(password):
         raise ValueError("Password must contain at least one special character: @, $, !, %, *, ?, #, &.")
     return password
 
@@ -25,3 +30,14 @@ def validate_email(user_email: str) -> str:
         raise ValueError(str(error))
     else:
         return email
+
+
+
+def validate_secure_token(token: str) -> bytes:
+    try:
+        raw_token = bytes.fromhex(token)
+    except ValueError:
+        raise ValueError("Token must be a hex-encoded string.")
+    if len(raw_token) != 32:
+        raise ValueError("Token must be 32 bytes long.")
+    return raw_token
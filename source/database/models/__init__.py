@@ -22,8 +22,8 @@ from database.models.movies import (
     CommentModel,
     FavoriteModel,
     RatingModel,
-    LikeModel,
-    DislikeModel
+    ReactionKindEnum,
+    ReactionModel
 )
 from database.models.carts import (
     CartModel,
@@ -3,16 +3,20 @@ from datetime import datetime, date, timedelta, timezone
 from typing import List, Optional
 
 from sqlalchemy import (
+    DDL,
+    event,
     ForeignKey,
     String,
     Boolean,
     DateTime,
-    Enum,
     Integer,
+    LargeBinary,
+    SmallInteger,
     func,
     Text,
     Date,
-    UniqueConstraint
+    Index,
+    select
 )
 from sqlalchemy.orm import (
     Mapped,
@@ -23,24 +27,24 @@ from sqlalchemy.orm import (
 from database.models.base import Base
 from database import account_validators
 from security.passwords import hash_password, verify_password
-from security.utils import generate_secure_token
+from security.utils import generate_secure_token, generate_secure_token_bytes
 
-class UserGroupsEnum(str, enum.Enum):
-    USER = "user"
-    MODERATOR = "moderator"
-    ADMIN = "admin"
+class UserGroupsEnum(enum.IntEnum):
+    USER = 1
+    MODERATOR = 2
+    ADMIN = 3
 
 
-class UserGenderEnum(str, enum.Enum):
-    MAN = "man"
-    WOMAN = "woman"
+class UserGenderEnum(enum.IntEnum):
+    MAN = 1
+    WOMAN = 2
 
 
 class UserGroupModel(Base):
     __tablename__ = "user_groups"
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    name: Mapped[UserGroupsEnum] = mapped_column(Enum(UserGroupsEnum), nullable=False, unique=True)
+    name: Mapped[UserGroupsEnum] = mapped_column(SmallInteger, nullable=False, unique=True)
     
     users: Mapped[List["UserModel"]] = relationship("UserModel", back_populates="group")
     
@@ -62,7 +66,12 @@ class UserModel(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
     group_id: Mapped[int] = mapped_column(ForeignKey("user_groups.id", ondelete="CASCADE"), nullable=False)
-    group: Mapped["UserGroupModel"] = relationship("UserGroupModel", back_populates="users")
+    group_name: Mapped[UserGroupsEnum] = mapped_column(SmallInteger, nullable=False, index=True)
+    group: Mapped["UserGroupModel"] = relationship(
+        "UserGroupModel",
+        back_populates="users",
+        lazy="raise"
+    )
     profile: Mapped["UserProfileModel"] = relationship(
         "UserProfileModel",
         back_populates="user",
@@ -103,12 +112,20 @@ class UserModel(Base):
         back_populates="user"
     )
     
+    __table_args__ = (Index("ix_users_email_active", "email", "is_active"),)
+    
     def __repr__(self):
         return f"<UserModel(id={self.id}, email={self.email}, is_active={self.is_active})>"
     
     @classmethod
-    def create(cls, email: str, raw_password: str, group_id: int | Mapped[int]) -> "UserModel":
-        user = cls(email=email, group_id=group_id)
+    def create(
+        cls,
+        email: str,
+        raw_password: str,
+        group_id: int | Mapped[int],
+        group_name: UserGroupsEnum = UserGroupsEnum.USER
+    ) -> "UserModel":
+        user = cls(email=email, group_id=group_id, group_name=group_name)
         user.password = raw_password
         return user
     
@@ -125,7 +142,44 @@ class UserModel(Base):
         return verify_password(raw_password, self._hashed_password)
     
     def has_group(self, group_name: UserGroupsEnum) -> bool:
-        return self.group.name == group_name
+        return self.group_name == group_name
+
+
+@event.listens_for(UserModel, "before_insert")
+def _fill_group_name(mapper, connection, target: UserModel) -> None:
+    # Resolved inside the INSERT itself, so ORM inserts that only set group_id
+    # still satisfy NOT NULL without an extra round-trip.
+    if target.group_name is None:
+        target.group_name = (
+            select(UserGroupModel.name)
+            .where(UserGroupModel.id == target.group_id)
+            .scalar_subquery()
+        )
+
+
+# Keeps the denormalized users.group_name in step with the referenced group.
+USER_GROUP_NAME_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_users_group_name_insert AFTER INSERT ON users BEGIN
+        UPDATE users SET group_name = (SELECT name FROM user_groups WHERE id = NEW.group_id)
+        WHERE id = NEW.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_users_group_name_update AFTER UPDATE OF group_id ON users BEGIN
+        UPDATE users SET group_name = (SELECT name FROM user_groups WHERE id = NEW.group_id)
+        WHERE id = NEW.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_user_groups_name_update AFTER UPDATE OF name ON user_groups BEGIN
+        UPDATE users SET group_name = NEW.name WHERE group_id = NEW.id;
+    END
+    """,
+)
+
+for trigger in USER_GROUP_NAME_TRIGGERS:
+    event.listen(Base.metadata, "after_create", DDL(trigger).execute_if(dialect="sqlite"))
 
 
 class UserProfileModel(Base):
@@ -135,7 +189,7 @@ class UserProfileModel(Base):
     first_name: Mapped[Optional[str]] = mapped_column(String(100))
     last_name: Mapped[Optional[str]] = mapped_column(String(100))
     avatar: Mapped[Optional[str]] = mapped_column(String(255))
-    gender: Mapped[Optional[UserGenderEnum]] = mapped_column(Enum(UserGenderEnum))
+    gender: Mapped[Optional[UserGenderEnum]] = mapped_column(SmallInteger)
     date_of_birth: Mapped[Optional[date]] = mapped_column(Date)
     info: Mapped[Optional[str]] = mapped_column(Text)
     user_id: Mapped[int] = mapped_column(
@@ -158,18 +212,22 @@ class TokenBaseModel(Base):
     __abstract__ = True
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    token: Mapped[str] = mapped_column(
-        String(64),
+    token: Mapped[bytes] = mapped_column(
+        LargeBinary(32),
         unique=True,
         nullable=False,
-        default=generate_secure_token
+        default=generate_secure_token_bytes
     )
     expires_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
         default= lambda: datetime.now(timezone.utc) + timedelta(days=1)
     )
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
 
 
 class ActivationTokenModel(TokenBaseModel):
@@ -205,8 +263,12 @@ class PasswordResetTokenModel(TokenBaseModel):
     __tablename__ = "passwrod_reset_token"
     
     user: Mapped[UserModel] = relationship("UserModel", back_populates="password_reset_token")
-    
-    __table_args__ = (UniqueConstraint("user_id"),)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+        index=True
+    )
     
     def __repr__(self):
         return f"<PasswordResetTokenModel(id={self.id}, token={self.token}, expires_at={self.expires_at})>"
@@ -2,7 +2,7 @@ from datetime import datetime
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy import (
-    Integer, ForeignKey, UniqueConstraint, DateTime, func
+    Integer, ForeignKey, UniqueConstraint, Index, DateTime, func
 )
 
 from database.models.base import Base
@@ -41,7 +41,7 @@ class CartItemModel(Base):
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     cart_id: Mapped[int] = mapped_column(Integer, ForeignKey("carts.id"), nullable=False)
-    movie_id: Mapped[int] = mapped_column(Integer, ForeignKey("movies.id"), nullable=False)
+    movie_id: Mapped[int] = mapped_column(Integer, ForeignKey("movies.id"), nullable=False, index=True)
     added_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -62,4 +62,6 @@ class PurchasedModel(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
-    movie_id: Mapped[int] = mapped_column(Integer, ForeignKey("movies.id"), nullable=False)
+    movie_id: Mapped[int] = mapped_column(Integer, ForeignKey("movies.id"), nullable=False, index=True)
+
+    __table_args__ = (Index("ix_purchased_user_movie", "user_id", "movie_id"),)
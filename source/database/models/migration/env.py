@@ -29,6 +29,13 @@ target_metadata = Base.metadata
 # ... etc.
 
 
+def include_name(name, type_, parent_names) -> bool:
+    # The FTS5 search table and its shadow tables are created by raw DDL.
+    if type_ == "table":
+        return not name.startswith("movies_fts")
+    return True
+
+
 def run_migrations_offline() -> None:
     engine = create_engine(settings.SQLITE_DB_URL.replace("+aiosqlite", ""))
     connectable = engine
@@ -38,7 +45,8 @@ def run_migrations_offline() -> None:
             connection=connection,
             target_metadata=target_metadata,
             compare_type=True,
-            compare_server_default=True
+            compare_server_default=True,
+            include_name=include_name
         )
 
         with context.begin_transaction():
@@ -54,7 +62,8 @@ def run_migrations_online() -> None:
             connection=connection,
             target_metadata=target_metadata,
             compare_type=True,
-            compare_server_default=True
+            compare_server_default=True,
+            include_name=include_name
         )
 
         with context.begin_transaction():
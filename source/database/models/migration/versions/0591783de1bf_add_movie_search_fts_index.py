@@ -0,0 +1,43 @@
+"""add movie search fts index
+
+Revision ID: 0591783de1bf
+Revises: 0ee54c88cf52
+Create Date: 2026-10-16 02:16:52.059965
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from database.models.movies import MOVIE_SEARCH_BACKFILL, MOVIE_SEARCH_DDL
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0591783de1bf'
+down_revision: Union[str, None] = '0ee54c88cf52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    create_table, *triggers = MOVIE_SEARCH_DDL
+    op.execute(create_table)
+    op.execute(MOVIE_SEARCH_BACKFILL)
+    for trigger in triggers:
+        op.execute(trigger)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_movies_fts_insert")
+    op.execute("DROP TRIGGER IF EXISTS trg_movies_fts_update")
+    op.execute("DROP TRIGGER IF EXISTS trg_movies_fts_delete")
+    op.execute("DROP TRIGGER IF EXISTS trg_movie_directors_fts_insert")
+    op.execute("DROP TRIGGER IF EXISTS trg_movie_directors_fts_delete")
+    op.execute("DROP TRIGGER IF EXISTS trg_movie_stars_fts_insert")
+    op.execute("DROP TRIGGER IF EXISTS trg_movie_stars_fts_delete")
+    op.execute("DROP TRIGGER IF EXISTS trg_directors_fts_update")
+    op.execute("DROP TRIGGER IF EXISTS trg_stars_fts_update")
+    op.execute("DROP TABLE IF EXISTS movies_fts")
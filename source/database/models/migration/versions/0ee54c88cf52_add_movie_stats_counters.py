@@ -0,0 +1,57 @@
+"""add movie stats counters
+
+Revision ID: 0ee54c88cf52
+Revises: bc40d271fa62
+Create Date: 2026-10-16 02:02:48.600258
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from database.models.movies import MOVIE_STATS_TRIGGERS
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0ee54c88cf52'
+down_revision: Union[str, None] = 'bc40d271fa62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('movies', sa.Column('like_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('movies', sa.Column('dislike_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('movies', sa.Column('favorite_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('movies', sa.Column('rating_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('movies', sa.Column('rating_sum', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        "UPDATE movies SET "
+        "like_count = (SELECT count(*) FROM reactions WHERE movie_id = movies.id AND kind = 1), "
+        "dislike_count = (SELECT count(*) FROM reactions WHERE movie_id = movies.id AND kind = -1), "
+        "favorite_count = (SELECT count(*) FROM favorites WHERE movie_id = movies.id), "
+        "rating_count = (SELECT count(*) FROM ratings WHERE movie_id = movies.id), "
+        "rating_sum = (SELECT coalesce(sum(rating), 0) FROM ratings WHERE movie_id = movies.id)"
+    )
+    for trigger in MOVIE_STATS_TRIGGERS:
+        op.execute(trigger)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_reactions_insert")
+    op.execute("DROP TRIGGER IF EXISTS trg_reactions_update")
+    op.execute("DROP TRIGGER IF EXISTS trg_reactions_delete")
+    op.execute("DROP TRIGGER IF EXISTS trg_favorites_insert")
+    op.execute("DROP TRIGGER IF EXISTS trg_favorites_delete")
+    op.execute("DROP TRIGGER IF EXISTS trg_ratings_insert")
+    op.execute("DROP TRIGGER IF EXISTS trg_ratings_update")
+    op.execute("DROP TRIGGER IF EXISTS trg_ratings_delete")
+    with op.batch_alter_table('movies') as batch_op:
+        batch_op.drop_column('rating_sum')
+        batch_op.drop_column('rating_count')
+        batch_op.drop_column('favorite_count')
+        batch_op.drop_column('dislike_count')
+        batch_op.drop_column('like_count')
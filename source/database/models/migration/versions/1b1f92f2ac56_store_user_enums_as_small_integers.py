@@ -0,0 +1,62 @@
+"""store user enums as small integers
+
+Revision ID: 1b1f92f2ac56
+Revises: d21fd82ece62
+Create Date: 2026-10-16 01:53:08.592447
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b1f92f2ac56'
+down_revision: Union[str, None] = 'd21fd82ece62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "UPDATE user_groups SET name = CASE name "
+        "WHEN 'USER' THEN 1 WHEN 'MODERATOR' THEN 2 WHEN 'ADMIN' THEN 3 END"
+    )
+    op.execute(
+        "UPDATE user_profiles SET gender = CASE gender "
+        "WHEN 'MAN' THEN 1 WHEN 'WOMAN' THEN 2 END"
+    )
+    with op.batch_alter_table('user_groups') as batch_op:
+        batch_op.alter_column('name',
+                              existing_type=sa.VARCHAR(length=9),
+                              type_=sa.SmallInteger(),
+                              existing_nullable=False)
+    with op.batch_alter_table('user_profiles') as batch_op:
+        batch_op.alter_column('gender',
+                              existing_type=sa.VARCHAR(length=5),
+                              type_=sa.SmallInteger(),
+                              existing_nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('user_profiles') as batch_op:
+        batch_op.alter_column('gender',
+                              existing_type=sa.SmallInteger(),
+                              type_=sa.VARCHAR(length=5),
+                              existing_nullable=True)
+    with op.batch_alter_table('user_groups') as batch_op:
+        batch_op.alter_column('name',
+                              existing_type=sa.SmallInteger(),
+                              type_=sa.VARCHAR(length=9),
+                              existing_nullable=False)
+    op.execute(
+        "UPDATE user_profiles SET gender = CASE gender "
+        "WHEN 1 THEN 'MAN' WHEN 2 THEN 'WOMAN' END"
+    )
+    op.execute(
+        "UPDATE user_groups SET name = CASE name "
+        "WHEN 1 THEN 'USER' WHEN 2 THEN 'MODERATOR' WHEN 3 THEN 'ADMIN' END"
+    )
@@ -0,0 +1,42 @@
+"""store movie uuid as native uuid
+
+Revision ID: 64a6b72dda95
+Revises: f8d046e9dc7b
+Create Date: 2026-10-16 01:58:21.856491
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '64a6b72dda95'
+down_revision: Union[str, None] = 'f8d046e9dc7b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Uuid is stored as 32 hex characters without dashes on SQLite.
+    op.execute("UPDATE movies SET uuid = lower(replace(uuid, '-', ''))")
+    with op.batch_alter_table('movies') as batch_op:
+        batch_op.alter_column('uuid',
+                              existing_type=sa.VARCHAR(length=255),
+                              type_=sa.Uuid(),
+                              existing_nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('movies') as batch_op:
+        batch_op.alter_column('uuid',
+                              existing_type=sa.Uuid(),
+                              type_=sa.VARCHAR(length=255),
+                              existing_nullable=False)
+    op.execute(
+        "UPDATE movies SET uuid = substr(uuid, 1, 8) || '-' || substr(uuid, 9, 4) || '-' "
+        "|| substr(uuid, 13, 4) || '-' || substr(uuid, 17, 4) || '-' || substr(uuid, 21)"
+    )
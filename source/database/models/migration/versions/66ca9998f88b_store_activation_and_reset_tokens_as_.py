@@ -0,0 +1,51 @@
+"""store activation and reset tokens as binary
+
+Revision ID: 66ca9998f88b
+Revises: 19b29c3a6f8c
+Create Date: 2026-10-16 01:54:58.952538
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '66ca9998f88b'
+down_revision: Union[str, None] = '19b29c3a6f8c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Outstanding text tokens cannot be converted, users request new ones.
+    op.execute("DELETE FROM activation_tokens")
+    op.execute("DELETE FROM passwrod_reset_token")
+    with op.batch_alter_table('activation_tokens') as batch_op:
+        batch_op.alter_column('token',
+                              existing_type=sa.VARCHAR(length=64),
+                              type_=sa.LargeBinary(length=32),
+                              existing_nullable=False)
+    with op.batch_alter_table('passwrod_reset_token') as batch_op:
+        batch_op.alter_column('token',
+                              existing_type=sa.VARCHAR(length=64),
+                              type_=sa.LargeBinary(length=32),
+                              existing_nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM passwrod_reset_token")
+    op.execute("DELETE FROM activation_tokens")
+    with op.batch_alter_table('passwrod_reset_token') as batch_op:
+        batch_op.alter_column('token',
+                              existing_type=sa.LargeBinary(length=32),
+                              type_=sa.VARCHAR(length=64),
+                              existing_nullable=False)
+    with op.batch_alter_table('activation_tokens') as batch_op:
+        batch_op.alter_column('token',
+                              existing_type=sa.LargeBinary(length=32),
+                              type_=sa.VARCHAR(length=64),
+                              existing_nullable=False)
@@ -0,0 +1,37 @@
+"""sync user group name
+
+Revision ID: 7e603fb7f6c5
+Revises: 66c9963f82c1
+Create Date: 2026-10-16 02:31:38.104350
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from database.models.accounts import USER_GROUP_NAME_TRIGGERS
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e603fb7f6c5'
+down_revision: Union[str, None] = '66c9963f82c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "UPDATE users SET group_name = "
+        "(SELECT user_groups.name FROM user_groups WHERE user_groups.id = users.group_id)"
+    )
+    for trigger in USER_GROUP_NAME_TRIGGERS:
+        op.execute(trigger)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_users_group_name_insert")
+    op.execute("DROP TRIGGER IF EXISTS trg_users_group_name_update")
+    op.execute("DROP TRIGGER IF EXISTS trg_user_groups_name_update")
@@ -0,0 +1,47 @@
+"""add server side created_at to payments and comments
+
+Revision ID: a9c3ca5a63ee
+Revises: 64a6b72dda95
+Create Date: 2026-10-16 02:00:50.682466
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c3ca5a63ee'
+down_revision: Union[str, None] = '64a6b72dda95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite cannot ADD COLUMN with a non-constant default, so the table is rebuilt.
+    with op.batch_alter_table('comments', recreate='always') as batch_op:
+        batch_op.add_column(sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False))
+    op.drop_index(op.f('ix_comments_movie_id'), table_name='comments')
+    op.create_index('ix_comments_movie_created', 'comments', ['movie_id', 'created_at'], unique=False)
+    with op.batch_alter_table('payments') as batch_op:
+        batch_op.alter_column('created_at',
+                              existing_type=sa.DATETIME(),
+                              server_default=sa.text('(CURRENT_TIMESTAMP)'),
+                              existing_nullable=False)
+    op.create_index(op.f('ix_payments_created_at'), 'payments', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_payments_created_at'), table_name='payments')
+    with op.batch_alter_table('payments') as batch_op:
+        batch_op.alter_column('created_at',
+                              existing_type=sa.DATETIME(),
+                              server_default=None,
+                              existing_nullable=False)
+    op.drop_index('ix_comments_movie_created', table_name='comments')
+    op.create_index(op.f('ix_comments_movie_id'), 'comments', ['movie_id'], unique=False)
+    with op.batch_alter_table('comments') as batch_op:
+        batch_op.drop_column('created_at')
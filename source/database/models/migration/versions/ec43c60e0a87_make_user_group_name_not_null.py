@@ -0,0 +1,50 @@
+"""make user group name not null
+
+Revision ID: ec43c60e0a87
+Revises: 7e603fb7f6c5
+Create Date: 2026-10-16 02:42:44.790745
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from database.models.accounts import USER_GROUP_NAME_TRIGGERS
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ec43c60e0a87'
+down_revision: Union[str, None] = '7e603fb7f6c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _drop_group_name_triggers() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_users_group_name_insert")
+    op.execute("DROP TRIGGER IF EXISTS trg_users_group_name_update")
+    op.execute("DROP TRIGGER IF EXISTS trg_user_groups_name_update")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "UPDATE users SET group_name = "
+        "(SELECT user_groups.name FROM user_groups WHERE user_groups.id = users.group_id) "
+        "WHERE group_name IS NULL"
+    )
+    # SQLite refuses to rebuild a table that a trigger still refers to.
+    _drop_group_name_triggers()
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.alter_column('group_name', existing_type=sa.SmallInteger(), nullable=False)
+    for trigger in USER_GROUP_NAME_TRIGGERS:
+        op.execute(trigger)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _drop_group_name_triggers()
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.alter_column('group_name', existing_type=sa.SmallInteger(), nullable=True)
+    for trigger in USER_GROUP_NAME_TRIGGERS:
+        op.execute(trigger)
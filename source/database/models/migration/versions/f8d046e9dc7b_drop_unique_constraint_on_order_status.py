@@ -0,0 +1,41 @@
+"""drop unique constraint on order status
+
+Revision ID: f8d046e9dc7b
+Revises: d68e02f49724
+Create Date: 2026-10-16 01:56:18.996196
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8d046e9dc7b'
+down_revision: Union[str, None] = 'd68e02f49724'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+naming_convention = {
+    "uq": "uq_%(table_name)s_%(column_0_name)s",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('orders', naming_convention=naming_convention) as batch_op:
+        batch_op.drop_constraint('uq_orders_status', type_='unique')
+    op.create_index(op.f('ix_orders_status'), 'orders', ['status'], unique=False)
+    op.create_index('ix_orders_user_status', 'orders', ['user_id', 'status'], unique=False)
+    op.drop_index(op.f('ix_orders_user_id'), table_name='orders')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_orders_user_id'), 'orders', ['user_id'], unique=False)
+    op.drop_index('ix_orders_user_status', table_name='orders')
+    op.drop_index(op.f('ix_orders_status'), table_name='orders')
+    with op.batch_alter_table('orders', naming_convention=naming_convention) as batch_op:
+        batch_op.create_unique_constraint('uq_orders_status', ['status'])
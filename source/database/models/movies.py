@@ -1,19 +1,25 @@
-import uuid
+import enum
 from datetime import datetime
+from uuid import UUID, uuid4
 
 from sqlalchemy.orm import Mapped, relationship, mapped_column
-from sqlalchemy import func
+from sqlalchemy import DDL, column, event, func, table
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.types import (
     Text,
     DECIMAL,
     String,
     Float,
     Integer,
-    DateTime
+    SmallInteger,
+    DateTime,
+    Uuid
 )
 from sqlalchemy.sql.schema import (ForeignKey,
                                    Table,
                                    Column,
+                                   Index,
                                    UniqueConstraint)
 
 from database.models.base import Base
@@ -34,7 +40,9 @@ MoviesGenresModel = Table(
         ForeignKey("genres.id", ondelete="CASCADE"),
         primary_key=True,
         nullable=False
-    )
+    ),
+    # The primary key leads with movie_id; genre filters start from the genre.
+    Index("ix_movie_genres_genre_movie", "genre_id", "movie_id")
 )
 
 MoviesDirectorsModel = Table(
@@ -72,6 +80,41 @@ MoviesStarsModel = Table(
 )
 
 
+async def _bulk_link(session: AsyncSession, association: Table, pairs: list[tuple[int, int]]) -> None:
+    if not pairs:
+        return
+    movie_column, related_column = (column.name for column in association.columns)
+    stmt = sqlite_insert(association).on_conflict_do_nothing()
+    await session.execute(
+        stmt,
+        [{movie_column: movie_id, related_column: related_id} for movie_id, related_id in pairs]
+    )
+
+
+async def bulk_link_genres(session: AsyncSession, pairs: list[tuple[int, int]]) -> None:
+    await _bulk_link(session, MoviesGenresModel, pairs)
+
+
+async def bulk_link_directors(session: AsyncSession, pairs: list[tuple[int, int]]) -> None:
+    await _bulk_link(session, MoviesDirectorsModel, pairs)
+
+
+async def bulk_link_stars(session: AsyncSession, pairs: list[tuple[int, int]]) -> None:
+    await _bulk_link(session, MoviesStarsModel, pairs)
+
+
+async def bulk_link_movie_tags(
+        session: AsyncSession,
+        movie_id: int,
+        genre_ids: list[int],
+        director_ids: list[int],
+        star_ids: list[int]
+) -> None:
+    await bulk_link_genres(session, [(movie_id, genre_id) for genre_id in genre_ids])
+    await bulk_link_directors(session, [(movie_id, director_id) for director_id in director_ids])
+    await bulk_link_stars(session, [(movie_id, star_id) for star_id in star_ids])
+
+
 class GenreModel(Base):
     __tablename__ = "genres"
     
@@ -139,10 +182,10 @@ class MovieModel(Base):
     __tablename__ = "movies"
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    uuid: Mapped[str] = mapped_column(
-        String(255),
+    uuid: Mapped[UUID] = mapped_column(
+        Uuid(as_uuid=True),
         unique=True,
-        default=lambda: str(uuid.uuid4()),
+        default=uuid4,
         nullable=False
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -150,14 +193,22 @@ class MovieModel(Base):
     time: Mapped[int] = mapped_column(Integer, nullable=False)
     imdb: Mapped[float] = mapped_column(Float, nullable=False)
     votes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
-    meta_score: Mapped[float] = mapped_column(Float, nullable=False)
-    gross: Mapped[float] = mapped_column(Float, nullable=False)
-    description: Mapped[str] = mapped_column(Text, nullable=False)
-    price: Mapped[float] = mapped_column(DECIMAL(10, 2), nullable=False)
+    # Not part of any list or detail response; loaded on first access.
+    meta_score: Mapped[float] = mapped_column(Float, nullable=False, deferred=True)
+    gross: Mapped[float] = mapped_column(Float, nullable=False, deferred=True)
+    description: Mapped[str] = mapped_column(Text, nullable=False, deferred=True)
+    price: Mapped[float] = mapped_column(DECIMAL(10, 2, asdecimal=False), nullable=False)
     certification_id: Mapped[int] = mapped_column(
         ForeignKey("certifications.id"),
-        nullable=False
+        nullable=False,
+        index=True
     )
+    # Maintained by the triggers in MOVIE_STATS_TRIGGERS.
+    like_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    dislike_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    favorite_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    rating_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    rating_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     
     certification: Mapped[CertificationModel] = relationship(back_populates="movies")
     genres: Mapped[list["GenreModel"]] = relationship(
@@ -198,6 +249,10 @@ class MovieModel(Base):
     
     __table_args__ = (
         UniqueConstraint("name", "year", "time", name="unique_movie"),
+        Index("ix_movies_year_imdb", "year", "imdb"),
+        Index("ix_movies_votes", "votes"),
+        Index("ix_movies_imdb", "imdb"),
+        Index("ix_movies_price", "price"),
     )
     
     def __repr__(self):
@@ -208,20 +263,27 @@ class CommentModel(Base):
     __tablename__ = "comments"
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
     movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"), nullable=False)
     comment: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     
     user: Mapped[UserModel] = relationship("UserModel", back_populates="comments")
     movie: Mapped[MovieModel] = relationship("MovieModel", back_populates="comments")
     
+    __table_args__ = (
+        Index("ix_comments_movie_created", "movie_id", "created_at"),
+    )
+    
 
 class FavoriteModel(Base):
     __tablename__ = "favorites"
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"), nullable=False)
+    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"), nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -229,7 +291,10 @@ class FavoriteModel(Base):
     user: Mapped["UserModel"] = relationship("UserModel", back_populates="favorites")
     movie: Mapped["MovieModel"] = relationship("MovieModel", back_populates="favorites")
     
-    __table_args__ = (UniqueConstraint("user_id", "movie_id", name="unique_favorite"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "movie_id", name="unique_favorite"),
+        Index("ix_favorites_user_created", "user_id", "created_at"),
+    )
 
 
 class RatingModel(Base):
@@ -237,23 +302,174 @@ class RatingModel(Base):
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     rating: Mapped[int] = mapped_column(Integer, nullable=False)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"), nullable=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
+    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"), nullable=False, index=True)
     
     movie: Mapped[MovieModel] = relationship("MovieModel", back_populates="ratings")
 
 
-class LikeModel(Base):
-    __tablename__ = "likes"
-    
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"), nullable=False)
+class ReactionKindEnum(enum.IntEnum):
+    LIKE = 1
+    DISLIKE = -1
 
 
-class DislikeModel(Base):
-    __tablename__ = "dislikes"
+class ReactionModel(Base):
+    __tablename__ = "reactions"
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"), nullable=False)
+    kind: Mapped[ReactionKindEnum] = mapped_column(SmallInteger, nullable=False)
+    
+    __table_args__ = (
+        UniqueConstraint("user_id", "movie_id", name="unique_reaction"),
+        Index("ix_reactions_movie_kind", "movie_id", "kind"),
+    )
+
+
+MOVIE_STATS_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_reactions_insert AFTER INSERT ON reactions BEGIN
+        UPDATE movies SET like_count = like_count + (NEW.kind = 1),
+                          dislike_count = dislike_count + (NEW.kind = -1)
+        WHERE id = NEW.movie_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_reactions_update AFTER UPDATE OF kind, movie_id ON reactions BEGIN
+        UPDATE movies SET like_count = like_count - (OLD.kind = 1),
+                          dislike_count = dislike_count - (OLD.kind = -1)
+        WHERE id = OLD.movie_id;
+        UPDATE movies SET like_count = like_count + (NEW.kind = 1),
+                          dislike_count = dislike_count + (NEW.kind = -1)
+        WHERE id = NEW.movie_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_reactions_delete AFTER DELETE ON reactions BEGIN
+        UPDATE movies SET like_count = like_count - (OLD.kind = 1),
+                          dislike_count = dislike_count - (OLD.kind = -1)
+        WHERE id = OLD.movie_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_favorites_insert AFTER INSERT ON favorites BEGIN
+        UPDATE movies SET favorite_count = favorite_count + 1 WHERE id = NEW.movie_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_favorites_delete AFTER DELETE ON favorites BEGIN
+        UPDATE movies SET favorite_count = favorite_count - 1 WHERE id = OLD.movie_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_ratings_insert AFTER INSERT ON ratings BEGIN
+        UPDATE movies SET rating_count = rating_count + 1, rating_sum = rating_sum + NEW.rating
+        WHERE id = NEW.movie_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_ratings_update AFTER UPDATE OF rating, movie_id ON ratings BEGIN
+        UPDATE movies SET rating_count = rating_count - 1, rating_sum = rating_sum - OLD.rating
+        WHERE id = OLD.movie_id;
+        UPDATE movies SET rating_count = rating_count + 1, rating_sum = rating_sum + NEW.rating
+        WHERE id = NEW.movie_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_ratings_delete AFTER DELETE ON ratings BEGIN
+        UPDATE movies SET rating_count = rating_count - 1, rating_sum = rating_sum - OLD.rating
+        WHERE id = OLD.movie_id;
+    END
+    """,
+)
+
+for trigger in MOVIE_STATS_TRIGGERS:
+    event.listen(Base.metadata, "after_create", DDL(trigger).execute_if(dialect="sqlite"))
+
+
+# Builds the search row of every movie whose id is in ``{ids}``.
+_MOVIE_SEARCH_ROWS = """
+        INSERT INTO movies_fts (rowid, name, description, director_names, star_names)
+        SELECT movies.id, movies.name, movies.description,
+               (SELECT group_concat(directors.name, ' ') FROM movie_directors
+                JOIN directors ON directors.id = movie_directors.director_id
+                WHERE movie_directors.movie_id = movies.id),
+               (SELECT group_concat(stars.name, ' ') FROM movie_stars
+                JOIN stars ON stars.id = movie_stars.star_id
+                WHERE movie_stars.movie_id = movies.id)
+        FROM movies WHERE movies.id IN ({ids})
+"""
+
+# Rebuilds the search row of every movie whose id is in ``{ids}``.
+_MOVIE_SEARCH_REFRESH = f"""
+        DELETE FROM movies_fts WHERE rowid IN ({{ids}});
+        {_MOVIE_SEARCH_ROWS.strip()};
+"""
+
+# Fills the index for movies that existed before the FTS table was created.
+MOVIE_SEARCH_BACKFILL = _MOVIE_SEARCH_ROWS.format(ids="SELECT id FROM movies")
+
+# Trigram tokenizer keeps the case-insensitive substring semantics of ILIKE '%...%'.
+MOVIE_SEARCH_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS movies_fts USING fts5(
+        name, description, director_names, star_names, tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_movies_fts_insert AFTER INSERT ON movies BEGIN
+        {_MOVIE_SEARCH_REFRESH.format(ids="NEW.id")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_movies_fts_update AFTER UPDATE OF name, description ON movies BEGIN
+        {_MOVIE_SEARCH_REFRESH.format(ids="NEW.id")}
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_movies_fts_delete AFTER DELETE ON movies BEGIN
+        DELETE FROM movies_fts WHERE rowid = OLD.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_movie_directors_fts_insert AFTER INSERT ON movie_directors BEGIN
+        {_MOVIE_SEARCH_REFRESH.format(ids="NEW.movie_id")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_movie_directors_fts_delete AFTER DELETE ON movie_directors BEGIN
+        {_MOVIE_SEARCH_REFRESH.format(ids="OLD.movie_id")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_movie_stars_fts_insert AFTER INSERT ON movie_stars BEGIN
+        {_MOVIE_SEARCH_REFRESH.format(ids="NEW.movie_id")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_movie_stars_fts_delete AFTER DELETE ON movie_stars BEGIN
+        {_MOVIE_SEARCH_REFRESH.format(ids="OLD.movie_id")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_directors_fts_update AFTER UPDATE OF name ON directors BEGIN
+        {_MOVIE_SEARCH_REFRESH.format(ids="SELECT movie_id FROM movie_directors WHERE director_id = NEW.id")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_stars_fts_update AFTER UPDATE OF name ON stars BEGIN
+        {_MOVIE_SEARCH_REFRESH.format(ids="SELECT movie_id FROM movie_stars WHERE star_id = NEW.id")}
+    END
+    """,
+)
+
+for statement in MOVIE_SEARCH_DDL:
+    event.listen(Base.metadata, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+# The virtual table is not part of the metadata, so drop_all() would leave it behind.
+event.listen(
+    Base.metadata, "before_drop", DDL("DROP TABLE IF EXISTS movies_fts").execute_if(dialect="sqlite")
+)
+
+# Query-only handle on the FTS table; the hidden ``movies_fts`` column is the MATCH target.
+movies_fts = table("movies_fts", column("rowid", Integer), column("movies_fts"))
@@ -2,7 +2,7 @@ import enum
 from datetime import datetime
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql.schema import ForeignKey
+from sqlalchemy.sql.schema import ForeignKey, Index
 from sqlalchemy import func
 from sqlalchemy.types import (
     Integer,
@@ -28,23 +28,25 @@ class OrderModel(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
     )
-    status: Mapped[OrderStatusEnum] = mapped_column(Enum(OrderStatusEnum), nullable=False, unique=True)
-    total_amount: Mapped[float] = mapped_column(DECIMAL(10, 2), nullable=False)
+    status: Mapped[OrderStatusEnum] = mapped_column(Enum(OrderStatusEnum), nullable=False, index=True)
+    total_amount: Mapped[float] = mapped_column(DECIMAL(10, 2, asdecimal=False), nullable=False)
 
     user: Mapped[UserModel] = relationship(UserModel, back_populates="order")
     order_items: Mapped[list["OrderItemModel"]] = relationship("OrderItemModel", back_populates="order", cascade="all, delete-orphan")
     payment: Mapped["PaymentModel"] = relationship("PaymentModel", back_populates="order")
+
+    __table_args__ = (Index("ix_orders_user_status", "user_id", "status"),)
     
 
 class OrderItemModel(Base):
     __tablename__ = "order_items"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    order_id: Mapped[int] = mapped_column(ForeignKey("orders.id"), nullable=False)
-    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"), nullable=False)
-    price_at_order: Mapped[float] = mapped_column(DECIMAL(10, 2), nullable=False)
+    order_id: Mapped[int] = mapped_column(ForeignKey("orders.id"), nullable=False, index=True)
+    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"), nullable=False, index=True)
+    price_at_order: Mapped[float] = mapped_column(DECIMAL(10, 2, asdecimal=False), nullable=False)
 
     order: Mapped[OrderModel] = relationship(OrderModel, back_populates="order_items")
     movie: Mapped[MovieModel] = relationship(MovieModel, back_populates="order_items")
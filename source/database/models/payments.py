@@ -1,7 +1,8 @@
 import enum
+from datetime import datetime
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, ForeignKey, DateTime, Enum, DECIMAL, Integer
+from sqlalchemy import String, ForeignKey, DateTime, Enum, DECIMAL, Integer, func
 
 from database.models.base import Base
 from database.models.accounts import UserModel
@@ -18,11 +19,13 @@ class PaymentModel(Base):
     __tablename__ = "payments"
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    order_id: Mapped[int] = mapped_column(ForeignKey("orders.id"), nullable=False)
-    created_at: Mapped[DateTime] = mapped_column(DateTime, nullable=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
+    order_id: Mapped[int] = mapped_column(ForeignKey("orders.id"), nullable=False, index=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
+    )
     status: Mapped[PaymentStatusEnum] = mapped_column(Enum(PaymentStatusEnum), nullable=False)
-    amount: Mapped[float] = mapped_column(DECIMAL(10, 2), nullable=False)
+    amount: Mapped[float] = mapped_column(DECIMAL(10, 2, asdecimal=False), nullable=False)
     external_payment_id: Mapped[str] = mapped_column(String(255), nullable=True)
     
     user: Mapped["UserModel"] = relationship("UserModel", back_populates="payments")
@@ -34,9 +37,9 @@ class PaymentItemModel(Base):
     __tablename__ = "payment_items"
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    payment_id: Mapped[int] = mapped_column(ForeignKey("payments.id"), nullable=False)
-    order_item_id: Mapped[int] = mapped_column(ForeignKey("order_items.id"), nullable=False)
-    price_at_payment: Mapped[float] = mapped_column(DECIMAL(10, 2), nullable=False)
+    payment_id: Mapped[int] = mapped_column(ForeignKey("payments.id"), nullable=False, index=True)
+    order_item_id: Mapped[int] = mapped_column(ForeignKey("order_items.id"), nullable=False, index=True)
+    price_at_payment: Mapped[float] = mapped_column(DECIMAL(10, 2, asdecimal=False), nullable=False)
     
     payment: Mapped["PaymentModel"] = relationship("PaymentModel", back_populates="payment_item")
     order_item: Mapped["OrderItemModel"] = relationship("OrderItemModel", back_populates="payment_item")
@@ -1,8 +1,10 @@
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from config.dependencies import get_settings 
 from database.models.base import Base
@@ -10,10 +12,54 @@ from database.models.base import Base
 settings = get_settings()
 
 SQLITE_DATABASE_URL = settings.SQLITE_DB_URL
-sqlite_engine = create_async_engine(SQLITE_DATABASE_URL, echo=False)
-AsyncSQLiteSessionLocal = sessionmaker(
+SYNC_SQLITE_DATABASE_URL = SQLITE_DATABASE_URL.replace("+aiosqlite", "")
+sqlite_engine = create_async_engine(
+    SQLITE_DATABASE_URL,
+    echo=False,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # A local database file cannot drop the connection, so checkouts skip
+    # the liveness round trip; sessions reuse pooled, already-configured
+    # connections instead of reconnecting per request.
+    pool_pre_ping=False,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    connect_args={"timeout": settings.DB_BUSY_TIMEOUT}
+)
+
+
+sync_sqlite_engine = create_engine(
+    SYNC_SQLITE_DATABASE_URL,
+    echo=False,
+    pool_pre_ping=True,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    connect_args={"timeout": settings.DB_BUSY_TIMEOUT}
+)
+
+
+@event.listens_for(sync_sqlite_engine, "connect")
+@event.listens_for(sqlite_engine.sync_engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+AsyncSQLiteSessionLocal = async_sessionmaker(
     bind=sqlite_engine,
-    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False
+)
+
+SyncSQLiteSessionLocal = sessionmaker(
+    bind=sync_sqlite_engine,
     expire_on_commit=False
 )
 
@@ -29,7 +75,30 @@ async def get_sqlite_db_contextmanager() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def analyze_sqlite_database() -> None:
+    # Refreshes sqlite_stat1 so the planner can pick between the movie sort
+    # and filter indexes; analysis_limit keeps this cheap on large tables.
+    async with sqlite_engine.connect() as conn:
+        await conn.exec_driver_sql("PRAGMA analysis_limit=400")
+        await conn.exec_driver_sql("ANALYZE")
+        await conn.commit()
+
+
 async def reset_sqlite_database() -> None:
-    async with sqlite_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
+    # The driver commits each DDL statement on its own, and foreign_keys can
+    # only be toggled outside a transaction, so BEGIN/COMMIT are issued by hand.
+    async with sqlite_engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        foreign_keys = await conn.scalar(text("PRAGMA foreign_keys"))
+        await conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        try:
+            await conn.exec_driver_sql("BEGIN")
+            try:
+                await conn.run_sync(Base.metadata.drop_all)
+                await conn.run_sync(Base.metadata.create_all)
+            except Exception:
+                await conn.exec_driver_sql("ROLLBACK")
+                raise
+            await conn.exec_driver_sql("COMMIT")
+        finally:
+            await conn.exec_driver_sql(f"PRAGMA foreign_keys={foreign_keys}")
@@ -1,8 +1,22 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
+from config.dependencies import get_settings, build_jwt_auth_manager
+from database.session_sqlite import analyze_sqlite_database
 from routes import accounts, carts, movies, orders, payments
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = get_settings()
+    await analyze_sqlite_database()
+    app.state.jwt_manager = build_jwt_auth_manager(settings)
+    yield
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.include_router(accounts.router, prefix="/accounts", tags=["accounts"])
 app.include_router(carts.router, prefix="/carts", tags=["carts"])
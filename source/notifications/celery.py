@@ -9,19 +9,22 @@ celery_app = Celery(
     "tasks",
     broker=settings.CELERY_BROKER_URL,
     backend=settings.CELERY_RESULT_BACKEND,
-    include=["src.tasks"],
+    include=["notifications.tasks"],
 )
 
-celery_app.cong.update(
+celery_app.conf.update(
     result_expires=3600,
     timezone="UTC",
-    brocker_connection_retry_on_startup=True,
+    broker_connection_retry_on_startup=True,
+    task_routes={
+        "notifications.tasks.send_*": {"queue": settings.CELERY_EMAIL_QUEUE},
+    },
 )
 
 celery_app.conf.beat_schedule = {
     "delete_expired_tokens_every_hour": {
         "task": "notifications.tasks.delete_expired_activation_tokens",
-        "schedule": crontab(hour="*/1")
+        "schedule": crontab(minute=0)
     },
 }
 
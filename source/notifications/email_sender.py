@@ -1,9 +1,11 @@
+import asyncio
 import logging
+from typing import Optional
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
 import aiosmtplib
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 
 from security.exceptions import BaseEmailError
 from notifications.interfaces import EmailSenderInterface
@@ -21,7 +23,7 @@ class EmailSender(EmailSenderInterface):
         template_dir: str,
         activation_email_template_name: str,
         activation_complete_email_template_name: str,
-        password_email_tempate_name: str,
+        password_email_template_name: str,
         password_complete_email_template_name: str,
     ):
         self._hostaname = hostname
@@ -31,29 +33,66 @@ class EmailSender(EmailSenderInterface):
         self._use_tls = use_tls
         self._activation_email_template_name = activation_email_template_name
         self._activation_complete_email_template_name = activation_complete_email_template_name
-        self._password_email_template_name = password_email_tempate_name
+        self._password_email_template_name = password_email_template_name
         self._password_complete_email_template_name = password_complete_email_template_name
         
-        self._env = Environment(loader=FileSystemLoader(template_dir))
+        # Templates are compiled once per process and never re-checked on disk.
+        self._env = Environment(
+            loader=FileSystemLoader(template_dir),
+            autoescape=select_autoescape(["html"]),
+            auto_reload=False,
+            bytecode_cache=FileSystemBytecodeCache()
+        )
+        
+        # One authenticated connection is reused across sends; the lock keeps
+        # concurrent requests from interleaving SMTP transactions on it.
+        self._smtp: Optional[aiosmtplib.SMTP] = None
+        self._lock = asyncio.Lock()
+    
+    async def _connect(self) -> aiosmtplib.SMTP:
+        smtp = aiosmtplib.SMTP(hostname=self._hostaname, port=self._port, start_tls=self._use_tls)
+        await smtp.connect()
+        await smtp.login(self._email, self._password)
+        return smtp
+    
+    async def close(self) -> None:
+        async with self._lock:
+            if self._smtp is not None and self._smtp.is_connected:
+                try:
+                    await self._smtp.quit()
+                except aiosmtplib.SMTPException:
+                    self._smtp.close()
+            self._smtp = None
     
-    async def _send_email(self, recipient: str, subject: str, html_content: str) -> None:
-        message = MIMEMultipart
+    async def _send_email(self, recipient: str | list[str], subject: str, html_content: str) -> None:
+        # A list is delivered as one message with every address in the envelope
+        # only, so recipients do not see each other.
+        recipients = [recipient] if isinstance(recipient, str) else recipient
+        message = MIMEMultipart("alternative")
         message["From"] = self._email
-        message["To"] = recipient
+        message["To"] = recipient if isinstance(recipient, str) else self._email
         message["Subject"] = subject
         message.attach(MIMEText(html_content, "html"))
         
-        try:
-            smtp = aiosmtplib.SMTP(hostname=self._hostaname, port=self._port, start_tls=self._use_tls)
-            await smtp.connect()
-            if self._use_tls:
-                await smtp.starttls()
-            await smtp.login(self._email, self._password)
-            await smtp.sendmail(self._email, [recipient], message.as_string())
-            await smtp.quit()
-        except aiosmtplib.SMTPException as error:
-            logging.error(f"Failed to send email to {recipient}: {error}")
-            raise BaseEmailError(f"Failed to send email to {recipient}: {error}")
+        async with self._lock:
+            try:
+                reused = self._smtp is not None and self._smtp.is_connected
+                if not reused:
+                    self._smtp = await self._connect()
+                try:
+                    await self._smtp.send_message(message, recipients=recipients)
+                except aiosmtplib.SMTPServerDisconnected:
+                    # Servers drop idle connections; retry once on a fresh one.
+                    if not reused:
+                        raise
+                    self._smtp = await self._connect()
+                    await self._smtp.send_message(message, recipients=recipients)
+            except aiosmtplib.SMTPException as error:
+                if self._smtp is not None:
+                    self._smtp.close()
+                    self._smtp = None
+                logging.error(f"Failed to send email to {recipient}: {error}")
+                raise BaseEmailError(f"Failed to send email to {recipient}: {error}")
     
     async def send_activation_email(self, email: str, activation_link: str) -> None:
         template = self._env.get_template(self._activation_email_template_name)
@@ -73,6 +112,12 @@ class EmailSender(EmailSenderInterface):
         subject = "Password reset request"
         await self._send_email(email, subject, html_content)
     
+    async def send_password_reset_complete_email(self, email: str, login_link: str) -> None:
+        template = self._env.get_template(self._password_complete_email_template_name)
+        html_content = template.render(email=email, login_link=login_link)
+        subject = "Your password has been successfully reset"
+        await self._send_email(email, subject, html_content)
+    
     async def send_remove_movie(self, email: str, movie_name: str, cart_id: int) -> None:
         html_content = f"""
             <p>Movie "{movie_name}" removed from cart with ID: {cart_id}</p>
@@ -80,6 +125,13 @@ class EmailSender(EmailSenderInterface):
         subject = f"{movie_name} removed from cart with id: {cart_id}"
         await self._send_email(email, subject, html_content)
     
+    async def send_remove_movie_bulk(self, emails: list[str], movie_name: str, cart_id: int) -> None:
+        html_content = f"""
+            <p>Movie "{movie_name}" removed from cart with ID: {cart_id}</p>
+        """
+        subject = f"{movie_name} removed from cart with id: {cart_id}"
+        await self._send_email(emails, subject, html_content)
+    
     async def send_email_payment_success(self, email: str, total_price: float, order_id: int, movies):
         html_content = f"""
         <p>Thank you for your purchase!</p>
@@ -17,3 +17,11 @@ class EmailSenderInterface(ABC):
     @abstractmethod
     async def send_password_reset_complete_email(self, email: str, login_link: str) -> None:
         pass
+    
+    @abstractmethod
+    async def send_remove_movie_bulk(self, emails: list[str], movie_name: str, cart_id: int) -> None:
+        pass
+    
+    @abstractmethod
+    async def close(self) -> None:
+        pass
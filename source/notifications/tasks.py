@@ -1,25 +1,84 @@
-from datetime import datetime
+import asyncio
+import logging
+from datetime import datetime, timezone
+from functools import lru_cache
 
-from celery import Celery
+from sqlalchemy import delete, select
 
+from config.dependencies import get_settings, build_accounts_email_notificator
 from notifications.celery import celery_app
-from database.models.accounts import ActivationTokenModel
-from database.session_sqlite import AsyncSQLiteSessionLocal
+from notifications.interfaces import EmailSenderInterface
+from security.exceptions import BaseEmailError
+from database.models.accounts import ActivationTokenModel, UserGroupModel, UserGroupsEnum, UserModel
+from database.session_sqlite import SyncSQLiteSessionLocal
 
-app = Celery("tasks", backend="redis://localhost", broker="redis://localhost")
+logger = logging.getLogger(__name__)
 
 
 @celery_app.task()
 def delete_expired_activation_tokens():
-    db = AsyncSQLiteSessionLocal
-    try:
-        expired_activation_tokens = db.query(ActivationTokenModel).filter(ActivationTokenModel.expires_at < datetime.now(datetime.timezone.utc)).all()
-        for token in expired_activation_tokens:
-            db.delete(token)
-        
-        db.commit()
-    except Exception:
-        db.rollback()
-        print(f"Error during expired token: {Exception}")
-    finally:
-        db.close()
+    with SyncSQLiteSessionLocal() as db:
+        try:
+            db.execute(
+                delete(ActivationTokenModel)
+                .where(ActivationTokenModel.expires_at < datetime.now(timezone.utc))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.exception("Failed to delete expired activation tokens")
+            raise
+
+
+# Each worker process keeps one event loop and one sender, so the sender's
+# SMTP connection is reused across tasks instead of reopened per email.
+@lru_cache(maxsize=1)
+def _get_email_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.new_event_loop()
+
+
+@lru_cache(maxsize=1)
+def _get_email_sender() -> EmailSenderInterface:
+    return build_accounts_email_notificator(get_settings())
+
+
+def _run_email(send) -> None:
+    _get_email_loop().run_until_complete(send)
+
+
+@celery_app.task(autoretry_for=(BaseEmailError,), retry_backoff=True, max_retries=5, ignore_result=True)
+def send_activation_email(email: str, activation_link: str) -> None:
+    _run_email(_get_email_sender().send_activation_email(email, activation_link))
+
+
+@celery_app.task(autoretry_for=(BaseEmailError,), retry_backoff=True, max_retries=5, ignore_result=True)
+def send_activation_complete_email(email: str, login_link: str) -> None:
+    _run_email(_get_email_sender().send_activation_complete_email(email, login_link))
+
+
+@celery_app.task(autoretry_for=(BaseEmailError,), retry_backoff=True, max_retries=5, ignore_result=True)
+def send_password_reset_email(email: str, reset_link: str) -> None:
+    _run_email(_get_email_sender().send_password_reset_email(email, reset_link))
+
+
+@celery_app.task(autoretry_for=(BaseEmailError,), retry_backoff=True, max_retries=5, ignore_result=True)
+def send_password_reset_complete_email(email: str, login_link: str) -> None:
+    _run_email(_get_email_sender().send_password_reset_complete_email(email, login_link))
+
+
+@celery_app.task(autoretry_for=(BaseEmailError,), retry_backoff=True, max_retries=5, ignore_result=True)
+def send_email_payment_success(email: str, total_price: float, order_id: int, movies: list[str]) -> None:
+    _run_email(_get_email_sender().send_email_payment_success(email, total_price, order_id, movies))
+
+
+@celery_app.task(autoretry_for=(BaseEmailError,), retry_backoff=True, max_retries=5, ignore_result=True)
+def send_remove_movie_notifications(movie_name: str, cart_id: int) -> None:
+    with SyncSQLiteSessionLocal() as db:
+        emails = db.scalars(
+            select(UserModel.email)
+            .join(UserModel.group)
+            .where(UserGroupModel.name == UserGroupsEnum.MODERATOR)
+        ).all()
+    if emails:
+        _run_email(_get_email_sender().send_remove_movie_bulk(list(emails), movie_name, cart_id))
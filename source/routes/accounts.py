@@ -1,16 +1,12 @@
-from typing import cast
-from datetime import datetime, timezone
-
-from fastapi import APIRouter, Depends, status, HTTPException
-from sqlalchemy import select, delete
+from fastapi import APIRouter, BackgroundTasks, Depends, status, HTTPException
+from sqlalchemy import bindparam, delete, func, lambda_stmt, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import contains_eager
 
-from config.dependencies import (get_settings,
-                                        get_accounts_email_notificator,
-                                        get_jwt_auth_manager)
-from config.settings import BaseAppSettings
+from config.cache import TTLCache
+from config.dependencies import get_settings, get_jwt_auth_manager
 from database.session_sqlite import get_sqlite_db
 from schemas.accounts import (
     UserRegistrationResponseSchema,
@@ -32,13 +28,65 @@ from database.models.accounts import (
     PasswordResetTokenModel,
     RefreshTokenModel
 )
-from notifications.email_sender import EmailSender
-from notifications.interfaces import EmailSenderInterface
+from notifications.tasks import (
+    send_activation_email,
+    send_activation_complete_email,
+    send_password_reset_email,
+    send_password_reset_complete_email
+)
 from security.interfaces import JWTAuthManagerInterface
+from security.passwords import hash_password, run_in_password_pool
 from security.exceptions import BaseSecurityError
+from security.dependencies import invalidate_cached_user
 
 router = APIRouter()
 
+settings = get_settings()
+
+_USER_GROUP_CACHE_TTL_SECONDS = 3600
+
+_user_group_id_cache = TTLCache(maxsize=len(UserGroupsEnum), ttl=_USER_GROUP_CACHE_TTL_SECONDS)
+
+# Hot lookups are built once; only the bound parameters change per request.
+_select_user_by_email = lambda_stmt(
+    lambda: select(UserModel).where(UserModel.email == bindparam("email"))
+)
+_select_valid_activation_token = lambda_stmt(
+    lambda: select(ActivationTokenModel)
+    .join(ActivationTokenModel.user)
+    .options(contains_eager(ActivationTokenModel.user))
+    .where(
+        UserModel.email == bindparam("email"),
+        ActivationTokenModel.token == bindparam("token"),
+        ActivationTokenModel.expires_at >= func.now()
+    )
+)
+_select_password_reset_state = lambda_stmt(
+    lambda: select(
+        UserModel.id,
+        UserModel.is_active,
+        PasswordResetTokenModel.id,
+        PasswordResetTokenModel.token,
+        (PasswordResetTokenModel.expires_at < func.now()).label("is_expired")
+    )
+    .outerjoin(PasswordResetTokenModel, PasswordResetTokenModel.user_id == UserModel.id)
+    .where(UserModel.email == bindparam("email"))
+)
+
+
+async def _get_user_group_id(db: AsyncSession, group_name: UserGroupsEnum) -> int | None:
+    """
+    Resolve a user group id, keeping it in process memory since groups are static.
+    """
+    group_id = _user_group_id_cache.get(group_name)
+    if group_id is None:
+        stmt = select(UserGroupModel.id).where(UserGroupModel.name == group_name)
+        group_id = (await db.execute(stmt)).scalar_one_or_none()
+        if group_id is not None:
+            _user_group_id_cache.set(group_name, group_id)
+    return group_id
+
+
 @router.post(
     "/add/"
 )
@@ -52,6 +100,7 @@ async def add_groups(db: AsyncSession = Depends(get_sqlite_db)):
     db.add(admin_group)
     
     await db.commit()
+    _user_group_id_cache.clear()
     
     return {
         "message": "User groups added successfully."
@@ -88,40 +137,41 @@ async def add_groups(db: AsyncSession = Depends(get_sqlite_db)):
 )
 async def register_user(
     user_data: UserRegistrationRequestSchema,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_sqlite_db),
 ) -> UserRegistrationResponseSchema:
-    stmt = select(UserModel).where(UserModel.email == user_data.email)
-    result = await db.execute(stmt)
-    existing_user = result.scalars().first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"A user with this email {user_data.email} already exists."
-        )
-    
-    stmt = select(UserGroupModel).where(UserGroupModel.name == UserGroupsEnum.USER)
-    result = await db.execute(stmt)
-    user_group = result.scalars().first()
-    if not user_group:
+    user_group_id = await _get_user_group_id(db, UserGroupsEnum.USER)
+    if user_group_id is None:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Default user group not found"
         )
 
+    hashed_password = await run_in_password_pool(hash_password, user_data.password)
     try:
-        new_user = UserModel.create(
-            email=str(user_data.email),
-            raw_password=user_data.password,
-            group_id=user_group.id,
+        stmt = (
+            sqlite_insert(UserModel)
+            .values({
+                UserModel.email: str(user_data.email),
+                UserModel._hashed_password: hashed_password,
+                UserModel.group_id: user_group_id,
+                UserModel.group_name: UserGroupsEnum.USER,
+            })
+            .on_conflict_do_nothing(index_elements=[UserModel.email])
+            .returning(UserModel.id)
         )
-        db.add(new_user)
-        await db.flush()
+        result = await db.execute(stmt)
+        new_user_id = result.scalar_one_or_none()
+        if new_user_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"A user with this email {user_data.email} already exists."
+            )
         
-        activation_token = ActivationTokenModel(user_id=new_user.id)
+        activation_token = ActivationTokenModel(user_id=new_user_id)
         db.add(activation_token)
         
         await db.commit()
-        await db.refresh(new_user)
     except SQLAlchemyError:
         await db.rollback()
         raise HTTPException(
@@ -131,12 +181,9 @@ async def register_user(
     else:
         activation_link = "http://127.0.0.1/accounts/activate/"
         
-        # await EmailSender.send_activation_email(
-        #     email=new_user.email,
-        #     activation_link=activation_link,
-        # )
+        background_tasks.add_task(send_activation_email.delay, str(user_data.email), activation_link)
         
-        return UserRegistrationResponseSchema.model_validate(new_user)
+        return UserRegistrationResponseSchema(id=new_user_id, email=user_data.email)
 
 
 @router.post(
@@ -172,27 +219,18 @@ async def register_user(
 )
 async def active_account(
     activation_data: UserActivationRequestSchema,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_sqlite_db),
 ) -> MessageResponseSchema:
-    stmt = (
-        select(ActivationTokenModel)
-        .options(joinedload(ActivationTokenModel.user))
-        .join(UserModel)
-        .where(
-            UserModel.email == activation_data.email,
-            ActivationTokenModel.token == activation_data.token
-        )
+    result = await db.execute(
+        _select_valid_activation_token,
+        {"email": activation_data.email, "token": activation_data.token}
     )
-    result = await db.execute(stmt)
-    token_record = result.scalars().first()
+    token_record = result.scalar_one_or_none()
     
-    now_utc = datetime.now(timezone.utc)
-    if not token_record or cast(datetime, token_record.expires_at).replace(tzinfo=timezone.utc) < now_utc:
-        if token_record:
-            await db.delete(token_record)
-            await db.commit()
+    if not token_record:
         raise HTTPException(
-            status=status.HTTP_400_BAD_REQUEST,
+            status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid or expired activation token."
         )
         
@@ -209,10 +247,7 @@ async def active_account(
     
     login_link = "http://127.0.0.1/accounts/login/"
     
-    # await EmailSender.send_activation_complete_email(
-    #     str(activation_data.email),
-    #     login_link
-    # )
+    background_tasks.add_task(send_activation_complete_email.delay, str(activation_data.email), login_link)
     
     return MessageResponseSchema(message="User account activated succesfuly.")
 
@@ -229,29 +264,32 @@ async def active_account(
 )
 async def request_password_reset_token(
     data: PasswordResetRequestSchema,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_sqlite_db),
 ) -> MessageResponseSchema:
-    stmt = select(UserModel).filter_by(email=data.email)
-    result = await db.execute(stmt)
-    user = result.scalars().first()
+    result = await db.execute(_select_user_by_email, {"email": data.email})
+    user = result.scalar_one_or_none()
     
     if not user or not user.is_active:
         return MessageResponseSchema(
             message="If you are registered, you will receive an email with instructions."
         )
     
-    await db.execute(delete(PasswordResetTokenModel).where(PasswordResetTokenModel.user_id == user.id))
-    
-    reset_token = PasswordResetTokenModel(user_id=cast(int, user.id))
-    db.add(reset_token)
+    reset_token = sqlite_insert(PasswordResetTokenModel).values(user_id=user.id)
+    await db.execute(
+        reset_token.on_conflict_do_update(
+            index_elements=[PasswordResetTokenModel.user_id],
+            set_={
+                "token": reset_token.excluded.token,
+                "expires_at": reset_token.excluded.expires_at
+            }
+        )
+    )
     await db.commit()
     
     password_reset_complete_link = "http://127.0.0.1/accounts/password-reset-complete/"
     
-    # await EmailSender.send_password_reset_email(
-    #     str(data.email),
-    #     password_reset_complete_link
-    # )
+    background_tasks.add_task(send_password_reset_email.delay, str(data.email), password_reset_complete_link)
     
     return MessageResponseSchema(
         message="If you are registered, you will receive an email with instructions."
@@ -303,46 +341,39 @@ async def request_password_reset_token(
 )
 async def reset_password(
     data: PasswordResetCompleteRequestSchema,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_sqlite_db),
-    email_sender: EmailSenderInterface = Depends(get_accounts_email_notificator)
 ) -> MessageResponseSchema:
-    stmt = select(UserModel).filter_by(email=data.email)
-    result = await db.execute(stmt)
-    user = result.scalars().first()
-    if not user or not user.is_active:
+    result = await db.execute(_select_password_reset_state, {"email": data.email})
+    row = result.first()
+    if not row or not row.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid email or token."
         )
+    user_id, _, token_id, token, is_expired = row
     
-    stmt = select(PasswordResetTokenModel).filter_by(user_id=user.id)
-    result = await db.execute(stmt)
-    token_record = result.scalars().first()
-    
-    if not token_record or token_record.token != data.token:
-        if token_record:
-            await db.run_sync(lambda s: s.delete(token_record))
+    if not token_id or token != data.token or is_expired:
+        if token_id:
+            await db.execute(delete(PasswordResetTokenModel).where(PasswordResetTokenModel.id == token_id))
             await db.commit()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid email or token."
         )
     
-    expires_at = cast(datetime, token_record.expires_at).replace(tzinfo=timezone.utc)
-    if expires_at < datetime.now(timezone.utc):
-        await db.run_sync(lambda s: s.delete(token_record))
-        await db.commit()
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid email or token"
-        )
-    
+    hashed_password = await run_in_password_pool(hash_password, data.password)
     try:
-        user.password = data.password
-        await db.run_sync(lambda s: s.delete(token_record))
+        await db.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(_hashed_password=hashed_password)
+        )
+        await db.execute(delete(PasswordResetTokenModel).where(PasswordResetTokenModel.id == token_id))
         await db.commit()
+        invalidate_cached_user(user_id)
     except SQLAlchemyError:
-        await db.rollback(),
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while resetting the password."
@@ -350,10 +381,7 @@ async def reset_password(
 
     login_link = "http://127.0.0.1/accounts/login/"
     
-    await EmailSender.send_password_reset_complete_email(
-        str(data.email),
-        login_link
-    )
+    background_tasks.add_task(send_password_reset_complete_email.delay, str(data.email), login_link)
     
     return MessageResponseSchema(
         message="Password reset successfuly"
@@ -402,14 +430,12 @@ async def reset_password(
 async def login_user(
     login_data: UserLoginRequestSchema,
     db: AsyncSession = Depends(get_sqlite_db),
-    settings: BaseAppSettings = Depends(get_settings),
     jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager), 
 ) -> UserLoginResponseSchema:
-    stmt = select(UserModel).filter_by(email=login_data.email)
-    result = db.execute(stmt)
-    user = result.scalars().first()
+    result = await db.execute(_select_user_by_email, {"email": login_data.email})
+    user = result.scalar_one_or_none()
     
-    if not user or not user.verify_password(login_data.password):
+    if not user or not await run_in_password_pool(user.verify_password, login_data.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid password or email."
@@ -430,10 +456,9 @@ async def login_user(
             token=jwt_refresh_token
         )
         db.add(refresh_token)
-        await db.flush()
         await db.commit()
     except SQLAlchemyError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while processing the request."
@@ -501,16 +526,16 @@ async def refresh_access_token(
     
     stmt = select(RefreshTokenModel).filter_by(token=token_data.refresh_token)
     result = await db.execute(stmt)
-    refresh_token_record = result.scalars().first()
+    refresh_token_record = result.scalar_one_or_none()
     if not refresh_token_record:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Refresh token not found",
         )
     
-    stmt = select(UserModel).filte_by(id=user_id)
+    stmt = select(UserModel).filter_by(id=user_id)
     result = await db.execute(stmt)
-    user = result.scalars().first()
+    user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
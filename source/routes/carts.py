@@ -4,15 +4,17 @@ from fastapi import (APIRouter,
                      status,
                      BackgroundTasks)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import select, and_, delete
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import raiseload, selectinload
 
+from config.route_caches import cart_cache, invalidate_cart
 from database.session_sqlite import get_sqlite_db
-from database.models.accounts import UserModel, UserGroupsEnum, UserGroupModel
+from database.models.accounts import UserModel, UserGroupsEnum
 from database.models.movies import MovieModel
-from config.dependencies import get_accounts_email_notificator
 from schemas.carts import CartResponseSchema, CartItemResponseSchema, CartCreateSchema
-from notifications.interfaces import EmailSenderInterface
+from notifications.tasks import send_remove_movie_notifications
 from database.models.carts import (PurchasedModel,
                                           CartModel,
                                           CartItemModel)
@@ -52,62 +54,68 @@ async def create_cart(
     cart_data: CartCreateSchema,
     db: AsyncSession = Depends(get_sqlite_db),
 ):
-    stmt = select(UserModel).where(UserModel.id == cart_data.user_id)
+    stmt = (
+        select(
+            MovieModel.id,
+            MovieModel.name,
+            PurchasedModel.id,
+            CartModel.id
+        )
+        .select_from(UserModel)
+        .outerjoin(MovieModel, MovieModel.id == cart_data.movie_id)
+        .outerjoin(PurchasedModel, and_(PurchasedModel.user_id == UserModel.id,
+                                        PurchasedModel.movie_id == MovieModel.id))
+        .outerjoin(CartModel, CartModel.user_id == UserModel.id)
+        .where(UserModel.id == cart_data.user_id)
+        .limit(1)
+    )
     result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
-    if not user:
+    row = result.first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found."
         )
+    movie_id, movie_name, purchase_id, cart_id = row
 
-    stmt = select(PurchasedModel).where(and_(PurchasedModel.movie_id == cart_data.movie_id,
-                                             PurchasedModel.user_id == cart_data.user_id))
-    result = await db.execute(stmt)
-    purchase = result.scalar_one_or_none()
-    if purchase:
+    if purchase_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="You have already bought this movie"
         )
 
-    stmt = select(MovieModel).where(MovieModel.id == cart_data.movie_id)
-    result = await db.execute(stmt)
-    movie = result.scalar_one_or_none()
-    if not movie:
+    if not movie_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Movie not found"
         )
 
-    stmt = select(CartModel).where(CartModel.user_id == cart_data.user_id)
-    result = await db.execute(stmt)
-    cart = result.scalar_one_or_none()
-    if not cart:
-        cart = CartModel(user_id=cart_data.user_id)
-        db.add(cart)
-        await db.commit()
-        await db.refresh(cart)
-
-    stmt = select(CartItemModel).where(and_(CartItemModel.cart_id == cart.id,
-                                            CartItemModel.movie_id == cart_data.movie_id))
-    result = await db.execute(stmt)
-    item_is_exist = result.scalar_one_or_none()
-    if item_is_exist:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Movie is already in the cart."
-        )
-
     try:
-        cart_item = CartItemModel(cart_id=cart.id, movie_id=movie.id)
+        if not cart_id:
+            insert_cart = sqlite_insert(CartModel).values(user_id=cart_data.user_id)
+            insert_cart = insert_cart.on_conflict_do_update(
+                index_elements=[CartModel.user_id],
+                set_={"user_id": insert_cart.excluded.user_id}
+            ).returning(CartModel.id)
+            result = await db.execute(insert_cart)
+            cart_id = result.scalar_one()
+
+        cart_item = CartItemModel(cart_id=cart_id, movie_id=movie_id)
         db.add(cart_item)
         await db.commit()
+        invalidate_cart(cart_data.user_id)
         return {
-            "message": f"{movie.name} added in cart successfully"
+            "message": f"{movie_name} added in cart successfully"
         }
+    except IntegrityError:
+        # unique (cart_id, movie_id) rejects a movie that is already in the cart.
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Movie is already in the cart."
+        )
     except SQLAlchemyError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid input data"
@@ -149,17 +157,30 @@ async def get_cart(
 ):
     stmt = select(UserModel).where(UserModel.id == user_id)
     result = await db.execute(stmt)
-    user = result.scalar_one_or_none()()
+    user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found."
         )
 
-    if user.group.name == UserGroupsEnum.ADMIN or user.id == user_id:
-        stmt = select(CartModel).where(user_id == user_id)
+    if user.has_group(UserGroupsEnum.ADMIN) or user.id == user_id:
+        cart_response = cart_cache.get(user_id)
+        if cart_response is not None:
+            return cart_response
+
+        stmt = (
+            select(CartModel)
+            .options(
+                selectinload(CartModel.cart_items)
+                .selectinload(CartItemModel.movie)
+                .selectinload(MovieModel.genres),
+                raiseload("*")
+            )
+            .where(CartModel.user_id == user_id)
+        )
         result = await db.execute(stmt)
-        cart = result.scalar_one_or_none()()
+        cart = result.scalar_one_or_none()
         if not cart:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -178,7 +199,9 @@ async def get_cart(
             for item in cart_items if item.movie
         ]
 
-        return CartResponseSchema(id=cart.id, items=movies_data)
+        cart_response = CartResponseSchema(id=cart.id, items=movies_data)
+        cart_cache.set(user_id, cart_response)
+        return cart_response
     else:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -230,33 +253,33 @@ async def clear_cart(
 ):
     stmt = select(UserModel).where(UserModel.id == user_id)
     result = await db.execute(stmt)
-    user = result.scalar_one_or_none()()
+    user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found."
         )
 
-    stmt = select(CartModel).where(user_id == user_id)
+    stmt = select(CartModel.id).where(CartModel.user_id == user_id)
     result = await db.execute(stmt)
-    cart = result.scalar_one_or_none()()
-    if not cart:
+    cart_id = result.scalar_one_or_none()
+    if not cart_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Cart not found."
         )
-    if not cart.cart_items:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cart is already empty."
-        )
 
     try:
-        for item in cart.cart_items:
-            await db.delete(item)
+        result = await db.execute(delete(CartItemModel).where(CartItemModel.cart_id == cart_id))
+        if not result.rowcount:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cart is already empty."
+            )
         await db.commit()
+        invalidate_cart(user_id)
 
-    except Exception:
+    except SQLAlchemyError:
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -300,60 +323,24 @@ async def remove_movie_from_cart(
     background_tasks: BackgroundTasks,
     user_id: int,
     db: AsyncSession = Depends(get_sqlite_db),
-    email_sender: EmailSenderInterface = Depends(get_accounts_email_notificator),
 ):
-    stmt = select(UserModel).where(UserModel.id == user_id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found."
-        )
-
-    stmt = select(MovieModel).where(MovieModel.id == movie_id)
-    result = await db.execute(stmt)
-    movie = result.scalar_one_or_none()()
-    if not movie:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Movie not found."
-        )
-
-    stmt = select(CartModel).where(user_id == user_id)
-    result = await db.execute(stmt)
-    cart = result.scalar_one_or_none()()
-    if not cart:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Cart not found."
+    stmt = (
+        delete(CartItemModel)
+        .where(
+            CartItemModel.cart_id == cart_id,
+            CartItemModel.movie_id == movie_id,
+            CartItemModel.cart_id.in_(select(CartModel.id).where(CartModel.user_id == user_id))
         )
-
-    stmt = select(CartItemModel).where(and_(cart_id == cart.id, movie_id == movie_id))
-    result = await db.execute(stmt)
-    cart_item = result.scalar_one_or_none()()
-    if not cart_item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Cart item not found."
+        .returning(
+            select(MovieModel.name).where(MovieModel.id == CartItemModel.movie_id).scalar_subquery()
         )
-
+        .execution_options(synchronize_session=False)
+    )
     try:
-        await db.delete(cart_item)
-        await db.commit()
-
-        stmt = (select(UserModel)
-                .join(UserGroupModel)
-                .filter(UserGroupModel == UserGroupsEnum.MODERATOR))
         result = await db.execute(stmt)
-        moderators = result.scalar().all()
-        for moderator in moderators:
-            background_tasks.add_task(
-                email_sender.send_remove_movie,
-                moderator.email,
-                movie.name,
-                cart_id
-            )
+        movie_name = result.scalar_one_or_none()
+        if movie_name is not None:
+            await db.commit()
     except SQLAlchemyError:
         await db.rollback()
         raise HTTPException(
@@ -361,6 +348,31 @@ async def remove_movie_from_cart(
             detail="Request failed."
         )
 
+    if movie_name is None:
+        # Nothing was deleted; work out which part of the request was wrong.
+        stmt = (
+            select(MovieModel.id, CartModel.id)
+            .select_from(UserModel)
+            .outerjoin(MovieModel, MovieModel.id == movie_id)
+            .outerjoin(CartModel, and_(CartModel.user_id == UserModel.id,
+                                       CartModel.id == cart_id))
+            .where(UserModel.id == user_id)
+        )
+        result = await db.execute(stmt)
+        row = result.first()
+        if not row:
+            detail = "User not found."
+        elif not row[0]:
+            detail = "Movie not found."
+        elif not row[1]:
+            detail = "Cart not found."
+        else:
+            detail = "Cart item not found."
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+
+    invalidate_cart(user_id)
+    background_tasks.add_task(send_remove_movie_notifications.delay, movie_name, cart_id)
+
     return {
-        "message": f"{movie.name} removed from cart id {cart.id} successfully"
+        "message": f"{movie_name} removed from cart id {cart_id} successfully"
     }
@@ -1,25 +1,38 @@
-import uuid
-from typing import List
+import base64
+import json
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import or_, select, func, and_
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import or_, select, func, and_, delete, tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload, contains_eager
 
+from config.route_caches import (
+    genres_cache,
+    invalidate_genres,
+    invalidate_movie,
+    invalidate_movie_listings,
+    movie_count_cache,
+    movie_detail_cache,
+    movie_list_cache
+)
 from database.session_sqlite import get_sqlite_db
 from database.models.accounts import UserModel
+from security.dependencies import get_current_user
 from database.models.movies import (
     MovieModel,
     GenreModel,
     StarModel,
     DirectorModel,
     CertificationModel,
-    LikeModel,
-    DislikeModel,
-    RatingModel,
+    ReactionKindEnum,
+    ReactionModel,
     CommentModel,
-    FavoriteModel
+    FavoriteModel,
+    bulk_link_movie_tags,
+    movies_fts
 )
 from schemas.movies import (
     MovieListItemSchema,
@@ -31,11 +44,127 @@ from schemas.movies import (
     CommentCreateSchema,
     FavoriteListResponseSchema,
     FavoriteSchema,
-    GenreSchema
+    GenreSchema,
+    DirectorSchema,
+    StarSchema
 )
+from schemas.accounts import CurrentUserSchema
 
 router = APIRouter()
 
+# Collections use selectinload so a page of movies costs one extra SELECT
+# per relationship instead of a row per combination; the many-to-one
+# certification is cheap to join.
+movie_listing_options = (
+    joinedload(MovieModel.certification),
+    selectinload(MovieModel.genres),
+    selectinload(MovieModel.directors),
+    selectinload(MovieModel.stars),
+)
+
+
+# Sort column and direction for every accepted sort_by value; a leading "-"
+# sorts descending. Movie id breaks ties so pages and cursors are stable.
+movie_sort_fields = {
+    "price": (MovieModel.price, False),
+    "-price": (MovieModel.price, True),
+    "year": (MovieModel.year, False),
+    "-year": (MovieModel.year, True),
+    "imdb": (MovieModel.imdb, False),
+    "-imdb": (MovieModel.imdb, True),
+    "votes": (MovieModel.votes, False),
+    "-votes": (MovieModel.votes, True),
+}
+
+
+def _encode_movie_cursor(sort_value, movie_id: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps([sort_value, movie_id]).encode()).decode()
+
+
+def _decode_movie_cursor(cursor: str) -> tuple:
+    try:
+        sort_value, movie_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        sort_value = movie_id = None
+    if not isinstance(movie_id, int) or not isinstance(sort_value, (int, float)):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor parameter"
+        )
+    return sort_value, movie_id
+
+
+def _movie_search_clause(search: str):
+    # The trigram index cannot match terms shorter than three characters.
+    if len(search) < 3:
+        return or_(
+            MovieModel.name.ilike(f"%{search}%"),
+            MovieModel.description.ilike(f"%{search}%"),
+            MovieModel.directors.any(DirectorModel.name.ilike(f"%{search}%")),
+            MovieModel.stars.any(StarModel.name.ilike(f"%{search}%"))
+        )
+    phrase = '"' + search.replace('"', '""') + '"'
+    matches = select(movies_fts.c.rowid).where(movies_fts.c.movies_fts.op("MATCH")(phrase))
+    return MovieModel.id.in_(matches)
+
+
+async def _get_or_add_by_name(db: AsyncSession, model, names: list[str]) -> list:
+    # One IN query per tag type; missing names are added to the session and
+    # get their ids with the next flush.
+    names = list(dict.fromkeys(names))
+    result = await db.execute(select(model).where(model.name.in_(names)))
+    by_name = {row.name: row for row in result.scalars()}
+    for name in names:
+        if name not in by_name:
+            by_name[name] = model(name=name)
+            db.add(by_name[name])
+    return [by_name[name] for name in names]
+
+
+async def _set_reaction(
+        db: AsyncSession,
+        movie_id: int,
+        user_id: int,
+        kind: ReactionKindEnum
+) -> Optional[int]:
+    # Inserts the reaction or flips an opposite one in a single statement;
+    # returns None when the user already has this kind of reaction.
+    stmt = sqlite_insert(ReactionModel).values(movie_id=movie_id, user_id=user_id, kind=kind)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ReactionModel.user_id, ReactionModel.movie_id],
+        set_={"kind": stmt.excluded.kind},
+        where=ReactionModel.kind != stmt.excluded.kind
+    ).returning(ReactionModel.id)
+    try:
+        result = await db.execute(stmt)
+        reaction_id = result.scalar_one_or_none()
+        await db.commit()
+    except IntegrityError:
+        # A foreign key failed; only now is it worth finding out which one.
+        await db.rollback()
+        result = await db.execute(select(MovieModel.id).where(MovieModel.id == movie_id))
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Movie not found"
+            )
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid input data.")
+    return reaction_id
+
+
+async def _get_movie_stats(db: AsyncSession, movie_id: int) -> tuple[int, int]:
+    stmt = select(MovieModel.like_count, MovieModel.dislike_count).where(MovieModel.id == movie_id)
+    result = await db.execute(stmt)
+    likes, dislikes = result.one()
+    return likes, dislikes
+
+
+# Only totals of large filtered sets are cached; small counts are cheap
+# enough to recompute.
+_MOVIE_COUNT_CACHE_MIN_ITEMS = 1000
+
+_movie_page_url = "/movies/?page={}&per_page={}".format
+
 
 @router.get(
     "/",
@@ -78,13 +207,14 @@ async def get_movie_list(
         sort_by: str = Query(None, description="Sort by: price, year, imdb, votes"),
         genre: str = None,
         year: int = None,
+        cursor: Optional[str] = Query(None, description="next_cursor of the previous page; replaces page"),
 ) -> MovieListResponseSchema:
-    stmt = select(MovieModel).distinct()
-    stmt = stmt.join(MovieModel.directors).join(MovieModel.stars).join(MovieModel.genres).options(
-            selectinload(MovieModel.directors),
-            selectinload(MovieModel.stars),
-            selectinload(MovieModel.genres)
-        )
+    cache_key = (page, per_page, search, min_rating, max_rating, certification, sort_by, genre, year, cursor)
+    content = movie_list_cache.get(cache_key)
+    if content is not None:
+        return Response(content=content, media_type="application/json")
+
+    stmt = select(MovieModel)
 
     if min_rating:
         stmt = stmt.where(MovieModel.imdb >= min_rating)
@@ -92,56 +222,34 @@ async def get_movie_list(
         stmt = stmt.where(MovieModel.imdb <= max_rating)
     if year:
         stmt = stmt.where(MovieModel.year == year)
-    
-        stmt = (stmt.join(MovieModel.genres)
-                .options(selectinload(MovieModel.genres))
-                .where(GenreModel.name == genre))
+    if genre:
+        stmt = stmt.where(MovieModel.genres.any(GenreModel.name == genre))
     if certification:
-        stmt = (stmt.join(MovieModel.certification)
-                .options(selectinload(MovieModel.genres))
-                .where(CertificationModel.name == certification))
+        stmt = stmt.join(MovieModel.certification).where(CertificationModel.name == certification)
     if search:
-        stmt = stmt.where(
-            or_(
-                MovieModel.name.ilike(f"%{search}%"),
-                MovieModel.description.ilike(f"%{search}%"),
-                DirectorModel.name.ilike(f"%{search}%"),
-                StarModel.name.ilike(f"%{search}%")
-            )
-        )
+        stmt = stmt.where(_movie_search_clause(search))
         
-    if sort_by:
-        sort_mapping = {
-            "price": MovieModel.price,
-            "year": MovieModel.year,
-            "imdb": MovieModel.imdb,
-            "votes": MovieModel.votes
-        }
-        sort_field = sort_mapping.get(sort_by.lstrip("-"))
-        if sort_field is None:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid sort_by parameter"
-            )
-
-        if sort_by.startswith("-"):
-            stmt = stmt.order_by(sort_field.desc())
-        else:
-            stmt = stmt.order_by(sort_field.asc())
-    else:
-        stmt = stmt.order_by(MovieModel.year.desc())
-
-    result = await db.execute(stmt)
-    movies = result.scalars().all()
-    if not movies:
+    sort_field = movie_sort_fields.get(sort_by or "-year")
+    if sort_field is None:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Movies not found."
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid sort_by parameter"
         )
-
-    count = select(func.count()).select_from(stmt.alias())
-    result = await db.execute(count)
-    items = result.scalar()
+    sort_field, descending = sort_field
+    if descending:
+        order_by = (sort_field.desc(), MovieModel.id.desc())
+    else:
+        order_by = (sort_field.asc(), MovieModel.id.asc())
+    after = _decode_movie_cursor(cursor) if cursor else None
+
+    count_key = (search, min_rating, max_rating, certification, genre, year)
+    items = movie_count_cache.get(count_key)
+    if items is None:
+        count = stmt.with_only_columns(func.count(MovieModel.id))
+        result = await db.execute(count)
+        items = result.scalar_one()
+        if items >= _MOVIE_COUNT_CACHE_MIN_ITEMS:
+            movie_count_cache.set(count_key, items)
 
     if not items:
         raise HTTPException(
@@ -149,30 +257,51 @@ async def get_movie_list(
             detail="Movies not found."
         )
 
-    stmt = stmt.offset((page - 1) * per_page).limit(per_page) 
-
+    stmt = stmt.options(*movie_listing_options).order_by(*order_by)
+    if after:
+        # Seek past the cursor row instead of counting off skipped rows.
+        position = tuple_(sort_field, MovieModel.id)
+        stmt = stmt.where(position < tuple_(*after) if descending else position > tuple_(*after))
+    else:
+        stmt = stmt.offset((page - 1) * per_page)
+    stmt = stmt.limit(per_page)
 
     total_pages = (items + per_page - 1) // per_page
 
     result = await db.execute(stmt)
-    movies = result.unique().scalars().all()
-
-    return MovieListResponseSchema(
-        movies=[MovieListItemSchema(
+    movies = result.scalars().all()
+    # No look-ahead row: it would have its collections selectin-loaded too.
+    # A cursor walk can therefore end on one empty page.
+    has_more = len(movies) == per_page if after else page * per_page < items
+    next_cursor = None
+    if has_more:
+        next_cursor = _encode_movie_cursor(getattr(movies[-1], sort_field.key), movies[-1].id)
+
+    # Rows come straight from the database, so the response is built without
+    # re-running field validation.
+    response = MovieListResponseSchema.model_construct(
+        movies=[MovieListItemSchema.model_construct(
             id=movie.id,
             name=movie.name,
             year=movie.year,
             time=movie.time,
             imdb=movie.imdb,
-            genres=[genre for genre in movie.genres],
-            directors=[director for director in movie.directors],
-            stars=[star for star in movie.stars]
+            genres=[GenreSchema.model_construct(id=genre.id, name=genre.name) for genre in movie.genres],
+            directors=[
+                DirectorSchema.model_construct(id=director.id, name=director.name)
+                for director in movie.directors
+            ],
+            stars=[StarSchema.model_construct(id=star.id, name=star.name) for star in movie.stars]
             ) for movie in movies],
-        prev_page=f"/movies/?page={page - 1}&per_page={per_page}" if page > 1 else None,
-        next_page=f"/movies/?page={page + 1}&per_page={per_page}" if page < total_pages else None,
+        prev_page=_movie_page_url(page - 1, per_page) if page > 1 and not after else None,
+        next_page=_movie_page_url(page + 1, per_page) if page < total_pages and not after else None,
+        next_cursor=next_cursor,
         total_pages=total_pages,
         total_items=items,
     )
+    content = response.model_dump_json().encode()
+    movie_list_cache.set(cache_key, content)
+    return Response(content=content, media_type="application/json")
 
 
 @router.post(
@@ -229,41 +358,11 @@ async def create_movie(
         await db.flush()
 
     try:
-        genres_list = []
-        for genre_name in movie_data.genres:
-            stmt = select(GenreModel).where(GenreModel.name == genre_name)
-            result = await db.execute(stmt)
-            genre = result.scalar_one_or_none()
-            if not genre:
-                genre = GenreModel(name=genre_name)
-                db.add(genre)
-                await db.flush()
-            genres_list.append(genre)
-
-        directors_list = []
-        for director_name in movie_data.directors:
-            stmt = select(DirectorModel).where(DirectorModel.name == director_name)
-            result = await db.execute(stmt)
-            director = result.scalar_one_or_none()
-            if not director:
-                director = DirectorModel(name=director_name)
-                db.add(director)
-                await db.flush()
-            directors_list.append(director)
-
-        stars_list = []
-        for star_name in movie_data.stars:
-            stmt = select(StarModel).where(StarModel.name == star_name)
-            result = await db.execute(stmt)
-            star = result.scalar_one_or_none()
-            if not star:
-                star = StarModel(name=star_name)
-                db.add(star)
-                await db.flush()
-            stars_list.append(star)
+        genres_list = await _get_or_add_by_name(db, GenreModel, movie_data.genres)
+        directors_list = await _get_or_add_by_name(db, DirectorModel, movie_data.directors)
+        stars_list = await _get_or_add_by_name(db, StarModel, movie_data.stars)
 
         movie = MovieModel(
-            uuid=str(uuid.uuid4()),
             name=movie_data.name,
             year=movie_data.year,
             time=movie_data.time,
@@ -272,14 +371,21 @@ async def create_movie(
             gross=movie_data.gross,
             description=movie_data.description,
             price=movie_data.price,
-            certification_id=certificate.id,
-            genres=genres_list,
-            directors=directors_list,
-            stars=stars_list
+            certification_id=certificate.id
         )
 
         db.add(movie)
+        await db.flush()
+        await bulk_link_movie_tags(
+            db,
+            movie.id,
+            [genre.id for genre in genres_list],
+            [director.id for director in directors_list],
+            [star.id for star in stars_list]
+        )
         await db.commit()
+        invalidate_genres()
+        invalidate_movie_listings()
         await db.refresh(movie)
         return MovieDetailSchema(
             id=movie.id,
@@ -299,6 +405,56 @@ async def create_movie(
         )
 
 
+@router.get(
+    "/genres/",
+    response_model=List[GenreSchema],
+    summary="Get list of genres.",
+    description="Endpoint get list of genres." ,
+    status_code=status.HTTP_200_OK   
+)
+async def get_genres(db: AsyncSession = Depends(get_sqlite_db)):
+    genres = genres_cache.get("all")
+    if genres is None:
+        result = await db.execute(select(GenreModel.id, GenreModel.name))
+        genres = [GenreSchema(id=genre_id, name=name) for genre_id, name in result]
+        genres_cache.set("all", genres)
+    return genres
+
+
+@router.post(
+    "/genres/",
+    response_model=GenreSchema,
+    summary="Create a new genre",
+    description="Create a new genre model",
+    responses= {
+        400: {
+            "description": "Genre is already exists.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Genre is already exists."}
+                }
+            },
+        }
+    },
+    status_code=status.HTTP_200_OK
+)
+async def create_genre(name: str, db: AsyncSession = Depends(get_sqlite_db)):
+    stmt = select(GenreModel).where(GenreModel.name == name)
+    result = await db.execute(stmt)
+    is_exist = result.scalar_one_or_none()
+    if is_exist:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            description="Genre is already exists."
+        )
+
+    genre = GenreModel(name=name)
+    db.add(genre)
+    await db.commit()
+    invalidate_genres()
+    return genre
+
+
 @router.get(
     "/{movie_id}/",
     response_model=MovieDetailSchema,
@@ -325,44 +481,26 @@ async def get_movie_by_id(
         movie_id: int,
         db: AsyncSession = Depends(get_sqlite_db),
 ) -> MovieDetailSchema:
-    stmt = select(MovieModel).where(MovieModel.id == movie_id).options(
-        joinedload(MovieModel.certification),
-        selectinload(MovieModel.genres),
-        selectinload(MovieModel.directors),
-        selectinload(MovieModel.stars),
-        selectinload(MovieModel.comments).joinedload(CommentModel.user),
-    )
-    result = await db.execute(stmt)
-    movie = result.scalar_one_or_none()
-
-    if not movie:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Movie with the given ID was not found."
-        )
-
-    for comment in movie.comments:
-        comment.user_email = comment.user.email
-
-    stmt = select(func.count()).where(LikeModel.movie_id == movie_id)
-    result = await db.execute(stmt)
-    likes = result.scalar() or 0
-
-    stmt = select(func.count()).where(DislikeModel.movie_id == movie_id)
-    result = await db.execute(stmt)
-    dislikes = result.scalar() or 0
+    movie_detail = movie_detail_cache.get(movie_id)
+    if movie_detail is None:
+        stmt = select(MovieModel).where(MovieModel.id == movie_id).options(*movie_listing_options)
+        result = await db.execute(stmt)
+        movie = result.scalar_one_or_none()
 
-    stmt = select(func.avg(RatingModel.rating)).where(RatingModel.movie_id == movie_id)
-    result = await db.execute(stmt)
-    rating = result.scalar()
-    if rating:
-        rating = round(float(rating), 1)
+        if not movie:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Movie with the given ID was not found."
+            )
 
-    movie_detail = MovieDetailSchema.model_validate(movie)
-    movie_detail.likes = likes
-    movie_detail.dislikes = dislikes
+        movie_detail = MovieDetailSchema.model_validate(movie)
+        movie_detail_cache.set(movie_id, movie_detail)
+        # The row just loaded already carries the trigger-maintained counters.
+        likes, dislikes = movie.like_count, movie.dislike_count
+    else:
+        likes, dislikes = await _get_movie_stats(db, movie_id)
 
-    return movie_detail
+    return movie_detail.model_copy(update={"likes": likes, "dislikes": dislikes})
 
 
 @router.delete(
@@ -386,25 +524,43 @@ async def get_movie_by_id(
                 }
             },
         },
+        409: {
+            "description": "Movie is still referenced.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Movie is referenced by other records and cannot be deleted."}
+                }
+            },
+        },
     },
 )
 async def delete_movie(
         movie_id: int,
         db: AsyncSession = Depends(get_sqlite_db),
 ):
+    # Genre, director and star links go with the movie through ON DELETE CASCADE.
+    stmt = (
+        delete(MovieModel)
+        .where(MovieModel.id == movie_id)
+        .execution_options(synchronize_session=False)
+    )
+    try:
+        result = await db.execute(stmt)
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Movie is referenced by other records and cannot be deleted."
+        )
 
-    stmt = select(MovieModel).where(MovieModel.id == movie_id)
-    result = await db.execute(stmt)
-    movie = result.scalars().first()
-
-    if not movie:
+    if not result.rowcount:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Movie with the given ID was not found."
         )
 
-    await db.delete(movie)
-    await db.commit()
+    invalidate_movie(movie_id)
 
     return {"detail": "Movie deleted successfully."}
 
@@ -471,43 +627,13 @@ async def update_movie(
         movie.certification_id = certificate.id
 
     if movie_data.genres:
-        genres = []
-        for genre_name in movie_data.genres:
-            stmt = select(GenreModel).where(GenreModel.name == genre_name)
-            result = await db.execute(stmt)
-            genre = result.scalar_one_or_none()()
-            if not genre:
-                genre = GenreModel(name=genre_name)
-                db.add(genre)
-                await db.flush()
-            genres.append(genre)
-        movie.genres = genres
+        movie.genres = await _get_or_add_by_name(db, GenreModel, movie_data.genres)
 
     if movie_data.directors:
-        directors = []
-        for director_name in movie_data.directors:
-            stmt = select(DirectorModel).where(DirectorModel.name == director_name)
-            result = await db.execute(stmt)
-            director = result.scalar_one_or_none()()
-            if not director:
-                director = DirectorModel(name=director_name)
-                db.add(director)
-                await db.flush()
-            directors.append(director)
-        movie.directors = directors
+        movie.directors = await _get_or_add_by_name(db, DirectorModel, movie_data.directors)
 
     if movie_data.stars:
-        stars = []
-        for star_name in movie_data.stars:
-            stmt = select(StarModel).where(StarModel.name == star_name)
-            result = await db.execute(stmt)
-            star = result.scalar_one_or_none()()
-            if not star:
-                star = StarModel(name=star_name)
-                db.add(star)
-                await db.flush()
-            stars.append(star)
-        movie.stars = stars
+        movie.stars = await _get_or_add_by_name(db, StarModel, movie_data.stars)
 
     try:
         await db.commit()
@@ -518,23 +644,17 @@ async def update_movie(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(IntegrityError)
         )
+    invalidate_movie(movie_id)
+    invalidate_genres()
         
-    stmt = select(func.count()).where(LikeModel.movie_id == movie_id)
-    result = await db.execute(stmt)
-    likes = result.scalar() or 0
-    
-    stmt = select(func.count()).where(DislikeModel.movie_id == movie_id)
-    result = await db.execute(stmt)
-    dislikes = result.scalar() or 0
-    
     return MovieDetailSchema(
             id=movie.id,
             name=movie.name,
             genres=[genre for genre in movie.genres],
             directors=[director for director in movie.directors],
             stars=[star for star in movie.stars],
-            likes=likes,
-            dislikes=dislikes
+            likes=movie.like_count,
+            dislikes=movie.dislike_count
         )
 
 
@@ -567,34 +687,14 @@ async def like_movie(
     user_id: int,
     db: AsyncSession = Depends(get_sqlite_db)
 ):
-    stmt = select(MovieModel).where(MovieModel.id == movie_id)
-    result = await db.execute(stmt)
-    movie = result.scalars().first()
-    if not movie:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Movie not found"
-        )
-
-    stmt = select(LikeModel).where(and_(LikeModel.user_id == user_id, LikeModel.movie_id == movie_id))
-    result = await db.execut(stmt)
-    like_is_exist = result.scalars().first()
-    if like_is_exist:
+    reaction_id = await _set_reaction(db, movie_id, user_id, ReactionKindEnum.LIKE)
+    if reaction_id is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Movie already liked."
         )
-    try:
-        new_like = LikeModel(movie_id=movie_id, user_id=user_id)
-        db.add(new_like)
-        await db.commit()
-        await db.refresh(new_like)
 
-        return {"message": "Movie liked", "like_id": new_like.id}
-
-    except IntegrityError:
-        await db.rollback()
-        raise HTTPException(status_code=400, detail="Invalid input data.")
+    return {"message": "Movie liked", "like_id": reaction_id}
 
 
 @router.post(
@@ -626,35 +726,14 @@ async def dislike_movie(
     user_id: int,
     db: AsyncSession = Depends(get_sqlite_db)
 ):
-    stmt = select(MovieModel).where(MovieModel.id == movie_id)
-    result = await db.execute(stmt)
-    movie = result.scalars().first()
-    if not movie:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Movie not found"
-        )
-
-    stmt = select(DislikeModel).where(and_(DislikeModel.user_id == user_id,
-                                           DislikeModel.movie_id == movie_id))
-    result = await db.execut(stmt)
-    dislike_is_exist = result.scalars().first()
-    if dislike_is_exist:
+    reaction_id = await _set_reaction(db, movie_id, user_id, ReactionKindEnum.DISLIKE)
+    if reaction_id is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Movie is already disliked."
         )
-    try:
-        new_dislike = DislikeModel(movie_id=movie_id, user_id=user_id)
-        db.add(new_dislike)
-        await db.commit()
-        await db.refresh(new_dislike)
 
-        return {"message": "Movie disliked", "dislike_id": new_dislike.id}
-
-    except IntegrityError:
-        await db.rollback()
-        raise HTTPException(status_code=400, detail="Invalid input data.")
+    return {"message": "Movie disliked", "dislike_id": reaction_id}
 
 
 @router.post(
@@ -675,8 +754,8 @@ async def dislike_movie(
 )
 async def create_comment(
         movie_id: int,
-        current_user: int,
         comment_data: CommentCreateSchema,
+        current_user: CurrentUserSchema = Depends(get_current_user),
         db: AsyncSession = Depends(get_sqlite_db),
 ):
     movie = await db.get(MovieModel, movie_id)
@@ -687,7 +766,7 @@ async def create_comment(
         )
 
     comment = CommentModel(
-        comment=comment_data.content,
+        comment=comment_data.comment,
         user_id=current_user.id,
         movie_id=movie_id
     )
@@ -726,16 +805,11 @@ async def get_comments(
         movie_id: int,
         db: AsyncSession = Depends(get_sqlite_db),
 ):
-    stmt = (select(CommentModel)
+    stmt = (select(CommentModel.id, CommentModel.user_id, CommentModel.movie_id)
            .where(CommentModel.movie_id == movie_id)
-           .options(joinedload(CommentModel.user))
            .order_by(CommentModel.created_at.desc()))
     result = await db.execute(stmt)
-    comments = result.scalars().all()
-
-    for comment in comments:
-        comment.user_id = comment.user.id
-    return comments
+    return result.mappings().all()
 
 
 @router.post(
@@ -764,7 +838,7 @@ async def get_comments(
 )
 async def add_to_favorites(
         movie_id: int,
-        current_user: int,
+        current_user: CurrentUserSchema = Depends(get_current_user),
         db: AsyncSession = Depends(get_sqlite_db)
 ):
     movie = await db.get(MovieModel, movie_id)
@@ -812,11 +886,11 @@ async def add_to_favorites(
 )
 async def remove_from_favorites(
         favorite_id: int,
-        current_user: int,
+        current_user: CurrentUserSchema = Depends(get_current_user),
         db: AsyncSession = Depends(get_sqlite_db),
 ):
     stmt = select(FavoriteModel).where(and_(FavoriteModel.id == favorite_id,
-                                            FavoriteModel.user_id == current_user))
+                                            FavoriteModel.user_id == current_user.id))
     result = await db.execute(stmt)
     favorite = result.scalars().first()
     if not favorite:
@@ -849,7 +923,7 @@ async def remove_from_favorites(
     status_code=status.HTTP_200_OK
 )
 async def get_favorites(
-        current_user: int,
+        current_user: CurrentUserSchema = Depends(get_current_user),
         page: int = Query(1, ge=1),
         per_page: int = Query(10, ge=1, le=20),
         year: int = None,
@@ -864,7 +938,7 @@ async def get_favorites(
     stmt = (
         select(MovieModel)
         .join(FavoriteModel)
-        .where(FavoriteModel.user_id == current_user)
+        .where(FavoriteModel.user_id == current_user.id)
     )
 
     if year:
@@ -887,8 +961,8 @@ async def get_favorites(
             or_(
                 MovieModel.name.ilike(f"%{search}%"),
                 MovieModel.description.ilike(f"%{search}%"),
-                DirectorModel.name.ilike(f"%{search}%"),
-                StarModel.name.ilike(f"%{search}%")
+                MovieModel.directors.any(DirectorModel.name.ilike(f"%{search}%")),
+                MovieModel.stars.any(StarModel.name.ilike(f"%{search}%"))
             )
         )
 
@@ -920,12 +994,7 @@ async def get_favorites(
 
     stmt = stmt.offset((page - 1) * per_page).limit(per_page)
 
-    result = await db.execute(stmt.options(
-        joinedload(MovieModel.certification),
-        selectinload(MovieModel.genres),
-        selectinload(MovieModel.directors),
-        selectinload(MovieModel.stars)
-    ))
+    result = await db.execute(stmt.options(*movie_listing_options))
     movies = result.unique().scalars().all()
 
     return FavoriteListResponseSchema(
@@ -934,50 +1003,3 @@ async def get_favorites(
         total_pages=(total_items + per_page - 1) // per_page,
         current_page=page
     )
-
-
-@router.get(
-    "/genres/",
-    response_model=List[GenreSchema],
-    summary="Get list of genres.",
-    description="Endpoint get list of genres." ,
-    status_code=status.HTTP_200_OK   
-)
-async def get_genres(db: AsyncSession = Depends(get_sqlite_db)):
-    stmt = select(GenreModel).options(selectinload(GenreModel.movies))
-    result = await db.execute(stmt)
-    genres = result.scalars().all()
-    return [GenreSchema(id=genre.id, name=genre.name) for genre in genres]
-
-
-@router.post(
-    "/genres/",
-    response_model=GenreSchema,
-    summary="Create a new genre",
-    description="Create a new genre model",
-    responses= {
-        400: {
-            "description": "Genre is already exists.",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Genre is already exists."}
-                }
-            },
-        }
-    },
-    status_code=status.HTTP_200_OK
-)
-async def create_genre(name: str, db: AsyncSession = Depends(get_sqlite_db)):
-    stmt = select(GenreModel).where(GenreModel.name == name)
-    result = await db.execute(stmt)
-    is_exist = result.scalar_one_or_none()()
-    if is_exist:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            description="Genre is already exists."
-        )
-
-    genre = GenreModel(name=name)
-    db.add(genre)
-    await db.commit()
-    return genre
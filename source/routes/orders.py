@@ -1,5 +1,5 @@
 import stripe
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy import and_
@@ -10,7 +10,7 @@ from database.models.accounts import UserModel
 from database.models.movies import MovieModel
 from database.models.carts import CartModel, CartItemModel, PurchasedModel
 from database.session_sqlite import get_sqlite_db 
-from notifications.email_sender import EmailSender
+from notifications.tasks import send_email_payment_success
 from database.models.payments import PaymentModel
 
 router = APIRouter()
@@ -90,7 +90,8 @@ async def create_order(data: OrderBaseSchema,
     if not movies_in_order:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
                             detail="No movies available for order")
-    total_amount = sum([movie.price for movie in movies_in_order])
+    # Money columns load as floats; round so sums like 0.1 + 0.2 store as 0.3.
+    total_amount = round(sum(movie.price for movie in movies_in_order), 2)
     
     try:
         order = OrderModel(
@@ -308,6 +309,7 @@ async def get_all_orders(
 )
 async def pay_order(order_id: int,
                     user_id: int,
+                    background_tasks: BackgroundTasks,
                     db: AsyncSession = Depends(get_sqlite_db)):
     stmt = select(UserModel).where(UserModel.id == user_id)
     result = await db.execute(stmt)
@@ -346,7 +348,7 @@ async def pay_order(order_id: int,
                     "product_data": {
                         "name": f"Order {order.id}",
                     },
-                    "unit_amount": int(order.total_amount * 100),
+                    "unit_amount": round(order.total_amount * 100),
                 },
                 "quantity": 1,
             }],
@@ -361,10 +363,11 @@ async def pay_order(order_id: int,
             db.add(payment)
             await db.commit()
             await db.refresh(payment)
-            await EmailSender.send_email_payment_success(email=user.email,
-                                                         total_price=order.total_amount,
-                                                         order_id=order.id,
-                                                         movies=movies)
+            background_tasks.add_task(send_email_payment_success.delay,
+                                      user.email,
+                                      order.total_amount,
+                                      order.id,
+                                      [movie.name for movie in movies])
        else:
             payment = PaymentModel(order_id=order.id,
                                    amount=order.total_amount,
@@ -380,7 +383,7 @@ async def pay_order(order_id: int,
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail="Failed to process payment")
     
-    return MessageSchema.model_validate(
+    return MessageSchema(
         message="Payment successful",
         detail=None
     )
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, EmailStr, field_validator
 
 from database import account_validators
+from database.models.accounts import UserGroupsEnum
 
 
 class BaseEmailPasswordSchema(BaseModel):
@@ -31,7 +32,12 @@ class PasswordResetRequestSchema(BaseModel):
 
 
 class PasswordResetCompleteRequestSchema(BaseEmailPasswordSchema):
-    token: str
+    token: bytes
+    
+    @field_validator("token", mode="before")
+    @classmethod
+    def validate_token(cls, value):
+        return account_validators.validate_secure_token(value)
 
 
 class UserLoginRequestSchema(BaseEmailPasswordSchema):
@@ -39,7 +45,7 @@ class UserLoginRequestSchema(BaseEmailPasswordSchema):
 
 
 class UserLoginResponseSchema(BaseModel):
-    acces_token: str
+    access_token: str
     refresh_token: str
     token_type: str = "bearer"
 
@@ -53,9 +59,26 @@ class UserRegistrationResponseSchema(BaseModel):
     }
 
 
+class CurrentUserSchema(BaseModel):
+    id: int
+    email: EmailStr
+    is_active: bool
+    group_id: int
+    group_name: UserGroupsEnum
+    
+    model_config = {
+        "from_attributes": True
+    }
+
+
 class UserActivationRequestSchema(BaseModel):
     email: EmailStr
-    token: str
+    token: bytes
+    
+    @field_validator("token", mode="before")
+    @classmethod
+    def validate_token(cls, value):
+        return account_validators.validate_secure_token(value)
 
 
 class MessageResponseSchema(BaseModel):
@@ -67,6 +90,6 @@ class TokenRefreshRequestSchema(BaseModel):
 
 
 class TokenRefreshResponseSchema(BaseModel):
-    acces_token: str
+    access_token: str
     token_type: str = "bearer"
     
\ No newline at end of file
@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from typing import Optional, List
+from uuid import UUID
 
 from pydantic import BaseModel, field_validator, Field
 
@@ -41,7 +42,7 @@ class CertificationSchema(BaseModel):
 
 
 class MovieBaseSchema(BaseModel):
-    uuid: str | None = None
+    uuid: UUID | None = None
     name: str
     year: int
     time: int
@@ -93,7 +94,7 @@ class MovieDetailSchema(BaseModel):
 
 
 class MovieCreateSchema(BaseModel):
-    uuid: str | None = None
+    uuid: UUID | None = None
     name: str
     year: int
     time: int
@@ -142,7 +143,7 @@ class MovieListItemSchema(BaseModel):
     stars: List[StarSchema]
     
     model_config = {
-        "from_attrinutes": True,
+        "from_attributes": True,
     }
 
 
@@ -150,6 +151,7 @@ class MovieListResponseSchema(BaseModel):
     movies: List[MovieListItemSchema]
     prev_page: Optional[str]
     next_page: Optional[str]
+    next_cursor: Optional[str] = None
     total_pages: int
     total_items: int
     
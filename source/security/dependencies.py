@@ -0,0 +1,89 @@
+import hashlib
+import time
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.cache import TTLCache
+from config.dependencies import get_jwt_auth_manager
+from database.session_sqlite import get_sqlite_db
+from database.models.accounts import UserModel
+from schemas.accounts import CurrentUserSchema
+from security.exceptions import BaseSecurityError, InvalidTokenError
+from security.interfaces import JWTAuthManagerInterface
+from security.utils import get_token
+
+_TOKEN_PAYLOAD_CACHE_TTL_SECONDS = 30
+_REJECTED_TOKEN_CACHE_TTL_SECONDS = 10
+_USER_CACHE_TTL_SECONDS = 60
+
+_token_payload_cache = TTLCache(maxsize=10_000, ttl=_TOKEN_PAYLOAD_CACHE_TTL_SECONDS)
+_rejected_token_cache = TTLCache(maxsize=10_000, ttl=_REJECTED_TOKEN_CACHE_TTL_SECONDS)
+_user_cache = TTLCache(maxsize=5_000, ttl=_USER_CACHE_TTL_SECONDS)
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def decode_access_token_cached(token: str, jwt_manager: JWTAuthManagerInterface) -> dict:
+    """
+    Decode an access token, reusing the payload of recently verified tokens.
+    Entries never outlive the token's own ``exp`` claim. Tokens that are
+    structurally invalid are rejected before any HMAC work, and recent
+    rejections are remembered so replayed garbage is refused from cache.
+    """
+    key = _token_cache_key(token)
+    payload = _token_payload_cache.get(key)
+    if payload is not None:
+        return payload
+
+    rejection = _rejected_token_cache.get(key)
+    if rejection is not None:
+        error_class, message = rejection
+        raise error_class(message)
+
+    try:
+        if token.count(".") != 2:
+            raise InvalidTokenError
+        payload = jwt_manager.decode_acccess_token(token)
+    except BaseSecurityError as error:
+        _rejected_token_cache.set(key, (type(error), str(error)))
+        raise
+
+    _token_payload_cache.set(key, payload, ttl=payload.get("exp", 0) - time.time())
+    return payload
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """
+    Drop the cached snapshot of a user whose credentials or state changed.
+    """
+    _user_cache.pop(user_id)
+
+
+async def get_current_user(
+    token: str = Depends(get_token),
+    jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager),
+    db: AsyncSession = Depends(get_sqlite_db),
+) -> CurrentUserSchema:
+    try:
+        payload = decode_access_token_cached(token, jwt_manager)
+    except BaseSecurityError as error:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(error)
+        )
+
+    user_id = payload.get("user_id")
+    user = _user_cache.get(user_id)
+    if user is None:
+        user_record = await db.get(UserModel, user_id)
+        if not user_record or not user_record.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found or not active."
+            )
+        user = CurrentUserSchema.model_validate(user_record)
+        _user_cache.set(user_id, user)
+    return user
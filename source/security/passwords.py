@@ -1,11 +1,24 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
 from passlib.context import CryptContext
 
+T = TypeVar("T")
+
 pwd_context = CryptContext(
     schemes=["bcrypt"],
-    bcrypt__rounds=14,
+    bcrypt__rounds=12,
     deprecated="auto"
 )
 
+# bcrypt releases the GIL, so a thread per core is enough to hash in parallel.
+_password_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count(),
+    thread_name_prefix="password-hashing"
+)
+
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
@@ -13,3 +26,11 @@ def hash_password(password: str) -> str:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
+
+
+async def run_in_password_pool(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run a CPU-bound hashing call off the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_pool, func, *args)
@@ -1,7 +1,9 @@
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from jose import jwt, JWTError, ExpiredSignatureError
+from jose import jwt, jwk, jws, JWSError
+from jose.backends.base import Key
+from orjson import loads as json_loads
 
 from security.exceptions import TokenExpiredError, InvalidTokenError
 from security.interfaces import JWTAuthManagerInterface
@@ -12,45 +14,56 @@ class JWTAuthManager(JWTAuthManagerInterface):
     _REFRESH_KEY_TIMEDELTA_MINUTES = 60 * 24 * 7
     
     def __init__(self, secret_key_access: str, secret_key_refresh: str, algorithm: str):
-        self._secret_key_access = secret_key_access
-        self._secret_key_refresh = secret_key_refresh
         self.algorithm = algorithm
+        self._access_key = jwk.construct(secret_key_access, algorithm)
+        self._refresh_key = jwk.construct(secret_key_refresh, algorithm)
     
-    def _create_token(self, data: dict, secret_key: str, expires_delta: timedelta) -> str:
+    def _create_token(self, data: dict, key: Key, expires_delta: timedelta) -> str:
         to_encode = data.copy()
         expire = datetime.now(timezone.utc) + expires_delta
         to_encode.update({"exp": expire})
-        return jwt.encode(to_encode, secret_key, algorithm=self.algorithm)
+        return jwt.encode(to_encode, key, algorithm=self.algorithm)
+    
+    def _decode_token(self, token: str, key: Key) -> dict:
+        """
+        Verify the signature with jose and parse the claims with orjson.
+        """
+        try:
+            payload = jws.verify(token, key, algorithms=[self.algorithm])
+            claims = json_loads(payload)
+        except (JWSError, ValueError):
+            raise InvalidTokenError
+        
+        if not isinstance(claims, dict):
+            raise InvalidTokenError
+        
+        expires_at = claims.get("exp")
+        if expires_at is not None:
+            if not isinstance(expires_at, int):
+                raise InvalidTokenError
+            if expires_at < datetime.now(timezone.utc).timestamp():
+                raise TokenExpiredError
+        return claims
     
     def create_access_token(self, data: dict, expires_delta: Optional[timedelta] = None) -> str:
         return self._create_token(
             data,
-            self._secret_key_access,
+            self._access_key,
             expires_delta or timedelta(minutes=self._ACCES_KEY_TIMEDELTA_MINUTES)
         )
     
     def create_refresh_token(self, data: dict, expires_delta: Optional[timedelta] = None) -> str:
         return self._create_token(
             data,
-            self._secret_key_refresh,
+            self._refresh_key,
             expires_delta or timedelta(minutes=self._REFRESH_KEY_TIMEDELTA_MINUTES)
         )
     
-    def decode_acccess_token(self, token: str) -> None:
-        try:
-            return jwt.decode(token, self._secret_key_access, algorithms=[self.algorithm])
-        except ExpiredSignatureError:
-            raise TokenExpiredError
-        except JWTError:
-            raise InvalidTokenError
+    def decode_acccess_token(self, token: str) -> dict:
+        return self._decode_token(token, self._access_key)
     
-    def decode_refresh_token(self, token: str) -> None:
-        try:
-            return jwt.decode(token, self._secret_key_refresh, algorithms=[self.algorithm])
-        except ExpiredSignatureError:
-            raise TokenExpiredError
-        except JWTError:
-            raise InvalidTokenError
+    def decode_refresh_token(self, token: str) -> dict:
+        return self._decode_token(token, self._refresh_key)
     
     def verify_access_token_or_raise(self, token: str) -> None:
         self.decode_acccess_token(token)
@@ -8,6 +8,12 @@ def generate_secure_token(length: int=32) -> str:
     """
     return secrets.token_urlsafe(length)
 
+def generate_secure_token_bytes(length: int=32) -> bytes:
+    """
+    Generate a secure random token as raw bytes, hex-encode it for clients
+    """
+    return secrets.token_bytes(length)
+
 def get_token(request: Request) -> str:
     authorization: str = request.headers.get("Authorization")
 
@@ -17,12 +23,10 @@ def get_token(request: Request) -> str:
             detail="Authorization header is missing"
         )
 
-    scheme, _, token = authorization.partition(" ")
-
-    if scheme.lower() != "bearer" or not token:
+    if len(authorization) <= 7 or authorization[:7].lower() != "bearer ":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid Authorization header format. Expected 'Bearer <token>'"
         )
 
-    return token
+    return authorization[7:]
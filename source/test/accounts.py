@@ -1,5 +1,10 @@
+import time
+
 import pytest
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import HTTPException, status
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker, Session
 from fastapi.testclient import TestClient
 
@@ -8,6 +13,7 @@ from database.models.accounts import (
     UserModel, UserGroupModel, ActivationTokenModel, UserGroupsEnum
 )
 from database.models.base import Base
+from security.exceptions import InvalidTokenError
 
 
 # Setting up the test database (SQLite in-memory)
@@ -52,7 +58,11 @@ def auth_headers(db_session: Session):
 
 def test_create_user(db_session):
     """ Tests user creation in the database. """
-    user = UserModel(email="user@example.com", group_id=1)
+    group = UserGroupModel(name=UserGroupsEnum.USER)
+    db_session.add(group)
+    db_session.commit()
+
+    user = UserModel(email="user@example.com", group_id=group.id)
     user.password = "SecureP@ss123"
     db_session.add(user)
     db_session.commit()
@@ -60,6 +70,7 @@ def test_create_user(db_session):
     saved_user = db_session.query(UserModel).filter_by(email="user@example.com").first()
     assert saved_user is not None
     assert saved_user.email == "user@example.com"
+    assert saved_user.group_name == UserGroupsEnum.USER
 
 
 def test_create_activation_token(db_session):
@@ -92,3 +103,101 @@ def test_user_group_assignment(db_session):
     saved_user = db_session.query(UserModel).filter_by(email="groupuser@example.com").first()
     assert saved_user is not None
     assert saved_user.has_group(UserGroupsEnum.USER)
+
+
+def test_malformed_token_rejected_without_decoding():
+    """ A token that is not three dot-separated segments never reaches the JWT manager. """
+    from security.dependencies import decode_access_token_cached, _rejected_token_cache
+    _rejected_token_cache.clear()
+    jwt_manager = MagicMock()
+
+    with pytest.raises(InvalidTokenError):
+        decode_access_token_cached("not-a-jwt", jwt_manager)
+
+    jwt_manager.decode_acccess_token.assert_not_called()
+
+
+def test_rejected_token_served_from_cache():
+    """ A replayed invalid token is refused from the rejection cache. """
+    from security.dependencies import (
+        decode_access_token_cached,
+        _rejected_token_cache,
+        _token_payload_cache
+    )
+    _rejected_token_cache.clear()
+    _token_payload_cache.clear()
+    jwt_manager = MagicMock()
+    jwt_manager.decode_acccess_token.side_effect = InvalidTokenError("Invalid token.")
+
+    for _ in range(2):
+        with pytest.raises(InvalidTokenError) as exc_info:
+            decode_access_token_cached("header.payload.signature", jwt_manager)
+        assert str(exc_info.value) == "Invalid token."
+
+    jwt_manager.decode_acccess_token.assert_called_once_with("header.payload.signature")
+
+
+def test_access_token_payload_cached():
+    """ A verified token is decoded once and then served from the payload cache. """
+    from security.dependencies import (
+        decode_access_token_cached,
+        _rejected_token_cache,
+        _token_payload_cache
+    )
+    _token_payload_cache.clear()
+    _rejected_token_cache.clear()
+    payload = {"user_id": 1, "exp": time.time() + 60}
+    jwt_manager = MagicMock()
+    jwt_manager.decode_acccess_token.return_value = payload
+
+    assert decode_access_token_cached("header.payload.signature", jwt_manager) == payload
+    assert decode_access_token_cached("header.payload.signature", jwt_manager) == payload
+
+    jwt_manager.decode_acccess_token.assert_called_once_with("header.payload.signature")
+
+
+def test_expired_token_payload_not_cached():
+    """ A payload whose exp has already passed is never served from the cache. """
+    from security.dependencies import (
+        decode_access_token_cached,
+        _rejected_token_cache,
+        _token_payload_cache
+    )
+    _token_payload_cache.clear()
+    _rejected_token_cache.clear()
+    jwt_manager = MagicMock()
+    jwt_manager.decode_acccess_token.return_value = {"user_id": 1, "exp": time.time() - 1}
+
+    decode_access_token_cached("header.payload.signature", jwt_manager)
+    decode_access_token_cached("header.payload.signature", jwt_manager)
+
+    assert jwt_manager.decode_acccess_token.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_register_user_duplicate_email():
+    """ Registering an email that already exists returns 409 and sends no email. """
+    from routes.accounts import register_user, _user_group_id_cache
+    from schemas.accounts import UserRegistrationRequestSchema
+    _user_group_id_cache.clear()
+
+    db = AsyncMock(spec=AsyncSession)
+    db.add = MagicMock()
+    db.execute.side_effect = [
+        MagicMock(scalar_one_or_none=MagicMock(return_value=1)),  # Default group id
+        MagicMock(scalar_one_or_none=MagicMock(return_value=None)),  # Insert skipped on conflict
+    ]
+    background_tasks = MagicMock()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await register_user(
+            user_data=UserRegistrationRequestSchema(email="test@example.com", password="Password123!"),
+            background_tasks=background_tasks,
+            db=db
+        )
+
+    assert exc_info.value.status_code == status.HTTP_409_CONFLICT
+    assert exc_info.value.detail == "A user with this email test@example.com already exists."
+    db.add.assert_not_called()
+    db.commit.assert_not_awaited()
+    background_tasks.add_task.assert_not_called()
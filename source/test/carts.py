@@ -1,46 +1,84 @@
 import pytest
 from fastapi import HTTPException, status
 from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.models.accounts import UserModel, UserGroupsEnum, UserGroupModel
 from database.models.movies import MovieModel
 from database.models.carts import CartModel, CartItemModel
 from schemas.carts import CartResponseSchema
-from notifications.interfaces import EmailSenderInterface
 
 @pytest.mark.asyncio
 async def test_create_cart_success():
-    user = UserModel(id=1)
-    movie = MovieModel(id=1, name="Test Movie")
-    cart = CartModel(id=1, user_id=1)
+    db = AsyncMock(spec=AsyncSession)
+    
+    db.execute.side_effect = [
+        MagicMock(first=MagicMock(return_value=(1, "Test Movie", None, 1))),
+    ]
+    
+    from routes.carts import create_cart
+    result = await create_cart(
+        cart_data=MagicMock(user_id=1, movie_id=1),
+        db=db
+    )
     
+    assert result == {"message": "Test Movie added in cart successfully"}
+    db.execute.assert_awaited_once()
+    db.add.assert_called_once()
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_create_cart_creates_missing_cart():
     db = AsyncMock(spec=AsyncSession)
     
     db.execute.side_effect = [
-        MagicMock(scalar_one_or_none=MagicMock(return_value=user)),
-        MagicMock(scalar_one_or_none=MagicMock(return_value=None)),
-        MagicMock(scalar_one_or_none=MagicMock(return_value=movie)),
-        MagicMock(scalar_one_or_none=MagicMock(return_value=None)),
-        MagicMock(scalar_one_or_none=MagicMock(return_value=None)),
+        MagicMock(first=MagicMock(return_value=(1, "Test Movie", None, None))),
+        MagicMock(scalar_one=MagicMock(return_value=7)),
     ]
     
-    from carts import create_cart
+    from routes.carts import create_cart
     result = await create_cart(
         cart_data=MagicMock(user_id=1, movie_id=1),
         db=db
     )
     
     assert result == {"message": "Test Movie added in cart successfully"}
-    assert db.add.call_count == 2
-    db.commit.assert_called_once()
+    assert db.execute.await_count == 2
+    cart_item = db.add.call_args.args[0]
+    assert cart_item.cart_id == 7
+    assert cart_item.movie_id == 1
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_create_cart_movie_already_in_cart():
+    db = AsyncMock(spec=AsyncSession)
+    
+    db.execute.side_effect = [
+        MagicMock(first=MagicMock(return_value=(1, "Test Movie", None, 1))),
+    ]
+    db.commit.side_effect = IntegrityError("INSERT", {}, Exception("UNIQUE constraint failed"))
+    
+    from routes.carts import create_cart
+    with pytest.raises(HTTPException) as exc_info:
+        await create_cart(
+            cart_data=MagicMock(user_id=1, movie_id=1),
+            db=db
+        )
+    
+    assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+    assert exc_info.value.detail == "Movie is already in the cart."
+    db.rollback.assert_awaited_once()
+
 
 @pytest.mark.asyncio
 async def test_create_cart_user_not_found():
     db = AsyncMock(spec=AsyncSession)
-    db.execute.return_value = MagicMock(scalar_one_or_none=MagicMock(return_value=None))
+    db.execute.return_value = MagicMock(first=MagicMock(return_value=None))
     
-    from carts import create_cart
+    from routes.carts import create_cart
     with pytest.raises(HTTPException) as exc_info:
         await create_cart(
             cart_data=MagicMock(user_id=1, movie_id=1),
@@ -88,71 +126,85 @@ async def test_get_cart_unauthorized():
 @pytest.mark.asyncio
 async def test_clear_cart_success():
     user = UserModel(id=1)
-    cart = CartModel(id=1, user_id=1)
-    cart_item = CartItemModel(id=1)
-    cart.cart_items = [cart_item]
     
     db = AsyncMock(spec=AsyncSession)
     db.execute.side_effect = [
-        MagicMock(scalar=MagicMock(first=MagicMock(return_value=user))),  # User query
-        MagicMock(scalar=MagicMock(first=MagicMock(return_value=cart))),  # Cart query
+        MagicMock(scalar_one_or_none=MagicMock(return_value=user)),  # User query
+        MagicMock(scalar_one_or_none=MagicMock(return_value=1)),  # Cart id query
+        MagicMock(rowcount=2),  # Bulk delete of the cart items
     ]
     
-    result = await cart(user_id=1, db=db)
+    from routes.carts import clear_cart
+    result = await clear_cart(user_id=1, db=db)
     
     assert result == {"detail": "Cart cleared successfully."}
-    db.delete.assert_called_once()
-    db.commit.assert_called_once()
+    assert db.execute.await_count == 3
+    db.delete.assert_not_awaited()
+    db.commit.assert_awaited_once()
 
 @pytest.mark.asyncio
 async def test_clear_cart_empty():
     user = UserModel(id=1)
-    cart = CartModel(id=1, user_id=1)
-    cart.cart_items = []
     
     db = AsyncMock(spec=AsyncSession)
     db.execute.side_effect = [
-        MagicMock(scalar=MagicMock(first=MagicMock(return_value=user))),
-        MagicMock(scalar=MagicMock(first=MagicMock(return_value=cart))),
+        MagicMock(scalar_one_or_none=MagicMock(return_value=user)),
+        MagicMock(scalar_one_or_none=MagicMock(return_value=1)),
+        MagicMock(rowcount=0),
     ]
     
+    from routes.carts import clear_cart
     with pytest.raises(HTTPException) as exc_info:
-        await cart(user_id=1, db=db)
+        await clear_cart(user_id=1, db=db)
     
     assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
     assert exc_info.value.detail == "Cart is already empty."
+    db.commit.assert_not_awaited()
 
 @pytest.mark.asyncio
 async def test_remove_movie_from_cart_success():
-    user = UserModel(id=1)
-    movie = MovieModel(id=1, name="Test Movie")
-    cart = CartModel(id=1, user_id=1)
-    cart_item = CartItemModel(id=1, movie=movie)
-    moderator = UserModel(email="moderator@test.com")
-    moderator.group = UserGroupModel(name=UserGroupsEnum.MODERATOR)
-    
     db = AsyncMock(spec=AsyncSession)
     db.execute.side_effect = [
-        MagicMock(scalar=MagicMock(first=MagicMock(return_value=user))),
-        MagicMock(scalar=MagicMock(first=MagicMock(return_value=movie))),
-        MagicMock(scalar=MagicMock(first=MagicMock(return_value=cart))),
-        MagicMock(scalar=MagicMock(first=MagicMock(return_value=cart_item))),
-        MagicMock(scalar=MagicMock(all=MagicMock(return_value=[moderator]))),
+        MagicMock(scalar_one_or_none=MagicMock(return_value="Test Movie")),
     ]
     
-    email_sender = MagicMock(spec=EmailSenderInterface)
     background_tasks = MagicMock()
     
-    result = await cart_item(
+    from routes.carts import remove_movie_from_cart, send_remove_movie_notifications
+    result = await remove_movie_from_cart(
         movie_id=1,
         cart_id=1,
         background_tasks=background_tasks,
         user_id=1,
-        db=db,
-        email_sender=email_sender
+        db=db
     )
     
     assert result == {"message": "Test Movie removed from cart id 1 successfully"}
-    db.delete.assert_called_once_with(cart_item)
-    db.commit.assert_called_once()
-    background_tasks.add_task.assert_called_once()
+    db.execute.assert_awaited_once()
+    db.commit.assert_awaited_once()
+    background_tasks.add_task.assert_called_once_with(
+        send_remove_movie_notifications.delay, "Test Movie", 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_remove_movie_from_cart_item_not_found():
+    db = AsyncMock(spec=AsyncSession)
+    db.execute.side_effect = [
+        MagicMock(scalar_one_or_none=MagicMock(return_value=None)),
+        MagicMock(first=MagicMock(return_value=(1, 1))),
+    ]
+    
+    from routes.carts import remove_movie_from_cart
+    with pytest.raises(HTTPException) as exc_info:
+        await remove_movie_from_cart(
+            movie_id=1,
+            cart_id=1,
+            background_tasks=MagicMock(),
+            user_id=1,
+            db=db
+        )
+    
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+    assert exc_info.value.detail == "Cart item not found."
+    db.commit.assert_not_awaited()
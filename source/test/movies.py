@@ -1,7 +1,10 @@
 from decimal import Decimal
 
 import pytest
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import HTTPException, status
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
 
@@ -10,9 +13,16 @@ from database.models.movies import (
     GenreModel,
     StarModel,
     DirectorModel,
-    CertificationModel
+    CertificationModel,
+    CommentModel,
+    FavoriteModel,
+    ReactionModel,
+    ReactionKindEnum
 )
-from database import Base
+from database.models.accounts import UserModel, UserGroupModel, UserGroupsEnum
+from database.models.base import Base
+from schemas.accounts import CurrentUserSchema
+from schemas.movies import CommentCreateSchema
 from main import app
 
 # Setting up the test database (SQLite in-memory)
@@ -61,6 +71,8 @@ def movie(db_session, genre, certification):
         time=107,
         imdb=8.1,
         votes=957000,
+        meta_score=84,
+        gross=38.4,
         price=10.00,
         certification_id=certification.id,
         description="A cyborg is sent from the future to kill the mother of the future leader of mankind.",
@@ -97,6 +109,8 @@ def test_create_movie(db_session):
         time=107,
         imdb=8.1,
         votes=957000,
+        meta_score=84,
+        gross=38.4,
         price=Decimal("10.00"),
         certification_id=1,
         description="A cyborg is sent from the future to kill the mother of the future leader of mankind."
@@ -135,3 +149,147 @@ def test_add_director_to_movie(db_session, movie, director):
     db_session.commit()
 
     assert director in movie.directors
+
+
+viewer = CurrentUserSchema(
+    id=7, email="viewer@example.com", is_active=True, group_id=1, group_name=UserGroupsEnum.USER
+)
+
+
+@pytest.mark.asyncio
+async def test_create_comment_as_current_user():
+    """ The comment is stored with the text from the request and the authenticated user's id. """
+    db = AsyncMock(spec=AsyncSession)
+    db.add = MagicMock()
+    db.get.return_value = MovieModel(id=1, name="The Terminator")
+
+    from routes.movies import create_comment
+    result = await create_comment(
+        movie_id=1,
+        comment_data=CommentCreateSchema(comment="Great movie"),
+        current_user=viewer,
+        db=db
+    )
+
+    assert isinstance(result, CommentModel)
+    assert result.comment == "Great movie"
+    assert result.user_id == 7
+    assert result.movie_id == 1
+    db.add.assert_called_once_with(result)
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_create_comment_movie_not_found():
+    db = AsyncMock(spec=AsyncSession)
+    db.get.return_value = None
+
+    from routes.movies import create_comment
+    with pytest.raises(HTTPException) as exc_info:
+        await create_comment(
+            movie_id=1,
+            comment_data=CommentCreateSchema(comment="Great movie"),
+            current_user=viewer,
+            db=db
+        )
+
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_add_to_favorites_as_current_user():
+    """ The favorite row belongs to the authenticated user. """
+    db = AsyncMock(spec=AsyncSession)
+    db.add = MagicMock()
+    db.get.return_value = MovieModel(id=1, name="The Terminator")
+    db.execute.return_value = MagicMock(
+        scalars=MagicMock(return_value=MagicMock(first=MagicMock(return_value=None)))
+    )
+
+    from routes.movies import add_to_favorites
+    result = await add_to_favorites(movie_id=1, current_user=viewer, db=db)
+
+    assert result == {"detail": "Movie added to favorites"}
+    favorite = db.add.call_args.args[0]
+    assert isinstance(favorite, FavoriteModel)
+    assert (favorite.user_id, favorite.movie_id) == (7, 1)
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_remove_from_favorites_of_another_user():
+    """ A favorite that does not belong to the current user is reported as missing. """
+    db = AsyncMock(spec=AsyncSession)
+    db.execute.return_value = MagicMock(
+        scalars=MagicMock(return_value=MagicMock(first=MagicMock(return_value=None)))
+    )
+
+    from routes.movies import remove_from_favorites
+    with pytest.raises(HTTPException) as exc_info:
+        await remove_from_favorites(favorite_id=1, current_user=viewer, db=db)
+
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+    db.delete.assert_not_awaited()
+
+
+def test_movie_cursor_round_trip():
+    """ A cursor decodes back to the sort value and id it was built from. """
+    from routes.movies import _encode_movie_cursor, _decode_movie_cursor
+
+    for sort_value, movie_id in [(8.1, 42), (1984, 7), (0, 1)]:
+        cursor = _encode_movie_cursor(sort_value, movie_id)
+        assert _decode_movie_cursor(cursor) == (sort_value, movie_id)
+
+
+def test_movie_cursor_invalid():
+    """ Garbage, empty and non-numeric cursors are rejected with 400. """
+    from routes.movies import _decode_movie_cursor
+
+    for cursor in ["not-base64!", "W10=", "WyJhIiwgMV0="]:
+        with pytest.raises(HTTPException) as exc_info:
+            _decode_movie_cursor(cursor)
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+        assert exc_info.value.detail == "Invalid cursor parameter"
+
+
+def test_reaction_flip_updates_counters(db_session, movie):
+    """ Switching a like to a dislike moves the vote between the movie counters. """
+    group = UserGroupModel(name=UserGroupsEnum.USER)
+    db_session.add(group)
+    db_session.commit()
+
+    user = UserModel(email="voter@example.com", group_id=group.id)
+    user.password = "Password123!"
+    db_session.add(user)
+    db_session.commit()
+
+    reaction = ReactionModel(user_id=user.id, movie_id=movie.id, kind=ReactionKindEnum.LIKE)
+    db_session.add(reaction)
+    db_session.commit()
+    db_session.refresh(movie)
+    assert (movie.like_count, movie.dislike_count) == (1, 0)
+
+    reaction.kind = ReactionKindEnum.DISLIKE
+    db_session.commit()
+    db_session.refresh(movie)
+    assert (movie.like_count, movie.dislike_count) == (0, 1)
+
+    db_session.delete(reaction)
+    db_session.commit()
+    db_session.refresh(movie)
+    assert (movie.like_count, movie.dislike_count) == (0, 0)
+
+
+def test_genres_route_not_shadowed_by_movie_id():
+    """ GET /genres/ must resolve to the genre list, not to /{movie_id}/. """
+    from starlette.routing import Match
+    from routes.movies import router, get_genres
+
+    scope = {"type": "http", "method": "GET", "path": "/genres/"}
+    endpoint = next(
+        route.endpoint for route in router.routes
+        if route.matches(scope)[0] == Match.FULL
+    )
+
+    assert endpoint is get_genres
@@ -89,9 +89,8 @@ async def test_get_orders_success():
 
 
 @pytest.mark.asyncio
-@patch('orders.stripe.checkout.Session.create')
-@patch('orders.EmailSender.send_email_payment_success')
-async def test_pay_order_success(email_sender, stripe_session):
+@patch('routes.orders.stripe.checkout.Session.create')
+async def test_pay_order_success(stripe_session):
     user = UserModel(id=1, email="test@example.com")
     order = OrderModel(id=1, user_id=1, total_amount=9.99, status="pending")
     order_item = OrderItemModel(id=1, order_id=1, movie_id=1, price_at_order=9.99)
@@ -100,39 +99,58 @@ async def test_pay_order_success(email_sender, stripe_session):
     stripe_session.return_value = MagicMock(success_url="http://success.com")
     
     db = AsyncMock(spec=AsyncSession)
+    db.add = MagicMock()
     db.execute.side_effect = [
-        MagicMock(scalars=MagicMock(first=MagicMock(return_value=user))),
-        MagicMock(scalars=MagicMock(all=MagicMock(return_value=[order_item]))),
-        MagicMock(scalars=MagicMock(first=MagicMock(return_value=movie))),
-        MagicMock(scalars=MagicMock(first=MagicMock(return_value=order)))
+        MagicMock(scalars=MagicMock(return_value=MagicMock(first=MagicMock(return_value=user)))),
+        MagicMock(scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=[order_item])))),
+        MagicMock(scalars=MagicMock(return_value=MagicMock(first=MagicMock(return_value=movie)))),
+        MagicMock(scalars=MagicMock(return_value=MagicMock(first=MagicMock(return_value=order)))),
     ]
     
-    result = await stripe_session.create(
-        payment_method_types=["card"],
-        line_items=[
-            {
-                "price_data": {
-                    "currency": "usd",
-                    "product_data": {
-                        "name": movie.name,
-                    },
-                    "unit_amount": int(order.total_amount * 100),
-                },
-                "quantity": 1,
-            }
-        ],
-        mode="payment",
-        success_url="http://success.com",
-        cancel_url="http://cancel.com",
+    background_tasks = MagicMock()
+    
+    from routes.orders import pay_order, send_email_payment_success
+    result = await pay_order(
+        order_id=1,
+        user_id=1,
+        background_tasks=background_tasks,
+        db=db
     )
     
     assert isinstance(result, MessageSchema)
     assert result.message == "Payment successful"
     stripe_session.assert_called_once()
-    email_sender.assert_called_once()
+    background_tasks.add_task.assert_called_once_with(
+        send_email_payment_success.delay, "test@example.com", 9.99, 1, ["Test Movie"]
+    )
     db.add.assert_called_once()
     db.commit.assert_called()
 
+@pytest.mark.asyncio
+@patch('routes.orders.stripe.checkout.Session.create')
+async def test_pay_order_charges_exact_cents(stripe_session):
+    user = UserModel(id=1, email="test@example.com")
+    order = OrderModel(id=1, user_id=1, total_amount=19.99, status="pending")
+    order_item = OrderItemModel(id=1, order_id=1, movie_id=1, price_at_order=19.99)
+    movie = MovieModel(id=1, name="Test Movie")
+    
+    stripe_session.return_value = MagicMock(success_url="http://success.com")
+    
+    db = AsyncMock(spec=AsyncSession)
+    db.add = MagicMock()
+    db.execute.side_effect = [
+        MagicMock(scalars=MagicMock(return_value=MagicMock(first=MagicMock(return_value=user)))),
+        MagicMock(scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=[order_item])))),
+        MagicMock(scalars=MagicMock(return_value=MagicMock(first=MagicMock(return_value=movie)))),
+        MagicMock(scalars=MagicMock(return_value=MagicMock(first=MagicMock(return_value=order)))),
+    ]
+    
+    from routes.orders import pay_order
+    await pay_order(order_id=1, user_id=1, background_tasks=MagicMock(), db=db)
+    
+    line_item = stripe_session.call_args.kwargs["line_items"][0]
+    assert line_item["price_data"]["unit_amount"] == 1999
+
 @pytest.mark.asyncio
 @patch('orders.stripe.checkout.Session.create')
 async def test_pay_order_failure(stripe_session):